@@ -1,5 +1,6 @@
-__all__ = ["Neo4jArrowClient", "model", "error"]
+__all__ = ["Neo4jArrowClient", "AsyncNeo4jArrowClient", "model", "error"]
 
 from ._client import Neo4jArrowClient
+from ._async_client import AsyncNeo4jArrowClient
 
 from . import model, error
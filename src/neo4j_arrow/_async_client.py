@@ -0,0 +1,239 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import threading
+
+import pyarrow as pa
+
+from ._client import Arrow, Edges, Neo4jArrowClient, Nodes, Result
+from .model import Graph
+
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+T = TypeVar("T")
+
+_END_OF_STREAM = object()
+
+
+class AsyncNeo4jArrowClient:
+    """
+    An asyncio facade over a Neo4jArrowClient. Each blocking call is run on a
+    small thread pool so async callers can overlap many Flight RPCs (e.g. for
+    different graphs) without managing threads themselves.
+    """
+
+    client: Neo4jArrowClient
+
+    def __init__(self, client: Neo4jArrowClient, *, pool_size: int = 3):
+        self.client = client
+        self._pool = ThreadPoolExecutor(max_workers=pool_size)
+
+    def __str__(self) -> str:
+        return f"AsyncNeo4jArrowClient{{{self.client}}}"
+
+    async def __aenter__(self) -> "AsyncNeo4jArrowClient":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    def close(self) -> None:
+        """Shut down the thread pool, waiting for pending calls to finish."""
+        self._pool.shutdown(wait=True)
+
+    async def aclose(self) -> None:
+        """
+        Shut down the thread pool, waiting for pending calls to finish without
+        blocking the event loop.
+        """
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    async def _run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, functools.partial(fn, *args, **kwargs))
+
+    async def _iterate(self, chunks: Iterator[Arrow]) -> AsyncGenerator[Arrow, None]:
+        # next() and close() may run on different pool threads, but must not
+        # overlap, e.g. when the task awaiting a chunk gets cancelled.
+        lock = threading.Lock()
+
+        def _next() -> Any:
+            with lock:
+                return next(chunks, _END_OF_STREAM)
+
+        def _close() -> None:
+            with lock:
+                close = getattr(chunks, "close", None)
+                if close:
+                    close()  # cancels the Flight stream if it wasn't fully read
+
+        try:
+            while True:
+                chunk = await self._run(_next)
+                if chunk is _END_OF_STREAM:
+                    return
+                yield chunk
+        finally:
+            await self._run(_close)
+
+    async def start(
+        self,
+        action: str = "CREATE_GRAPH",
+        *,
+        config: Optional[Dict[str, Any]] = None,
+        force: bool = False,
+    ) -> Dict[str, Any]:
+        return await self._run(self.client.start, action, config=config, force=force)
+
+    async def start_create_graph(
+        self,
+        *,
+        force: bool = False,
+        undirected_rel_types: Iterable[str] = [],
+        inverse_indexed_rel_types: Iterable[str] = [],
+    ) -> Dict[str, Any]:
+        return await self._run(
+            self.client.start_create_graph,
+            force=force,
+            undirected_rel_types=undirected_rel_types,
+            inverse_indexed_rel_types=inverse_indexed_rel_types,
+        )
+
+    async def start_create_database(
+        self,
+        *,
+        force: bool = False,
+        id_type: str = "",
+        id_property: str = "",
+        record_format: str = "",
+        high_io: bool = True,
+        use_bad_collector: bool = False,
+    ) -> Dict[str, Any]:
+        return await self._run(
+            self.client.start_create_database,
+            force=force,
+            id_type=id_type,
+            id_property=id_property,
+            record_format=record_format,
+            high_io=high_io,
+            use_bad_collector=use_bad_collector,
+        )
+
+    async def write_nodes(
+        self,
+        nodes: Nodes,
+        model: Optional[Graph] = None,
+        source_field: Optional[str] = None,
+        batch_rows: Optional[int] = None,
+    ) -> Result:
+        return await self._run(self.client.write_nodes, nodes, model, source_field, batch_rows)
+
+    async def nodes_done(self) -> Dict[str, Any]:
+        return await self._run(self.client.nodes_done)
+
+    async def write_edges(
+        self,
+        edges: Edges,
+        model: Optional[Graph] = None,
+        source_field: Optional[str] = None,
+        batch_rows: Optional[int] = None,
+    ) -> Result:
+        return await self._run(self.client.write_edges, edges, model, source_field, batch_rows)
+
+    async def edges_done(self) -> Dict[str, Any]:
+        return await self._run(self.client.edges_done)
+
+    def read_edges(
+        self,
+        *,
+        properties: Optional[List[str]] = None,
+        relationship_types: Optional[List[str]] = None,
+        concurrency: int = 4,
+        streams: int = 1,
+    ) -> AsyncGenerator[Arrow, None]:
+        """
+        Asynchronously stream edges (relationships), see
+        Neo4jArrowClient.read_edges.
+        """
+        chunks = self.client.read_edges(
+            properties=properties, relationship_types=relationship_types, concurrency=concurrency, streams=streams
+        )
+        return self._iterate(chunks)
+
+    async def read_edges_as_table(
+        self,
+        *,
+        properties: Optional[List[str]] = None,
+        relationship_types: Optional[List[str]] = None,
+        concurrency: int = 4,
+        streams: int = 1,
+    ) -> pa.Table:
+        return await self._run(
+            self.client.read_edges_as_table,
+            properties=properties,
+            relationship_types=relationship_types,
+            concurrency=concurrency,
+            streams=streams,
+        )
+
+    async def read_edges_into(
+        self,
+        sink: Union[str, pa.NativeFile],
+        *,
+        properties: Optional[List[str]] = None,
+        relationship_types: Optional[List[str]] = None,
+        concurrency: int = 4,
+    ) -> int:
+        return await self._run(
+            self.client.read_edges_into,
+            sink,
+            properties=properties,
+            relationship_types=relationship_types,
+            concurrency=concurrency,
+        )
+
+    def read_nodes(
+        self,
+        properties: Optional[List[str]] = None,
+        *,
+        labels: Optional[List[str]] = None,
+        concurrency: int = 4,
+    ) -> AsyncGenerator[Arrow, None]:
+        """
+        Asynchronously stream node properties, see Neo4jArrowClient.read_nodes.
+        """
+        chunks = self.client.read_nodes(properties, labels=labels, concurrency=concurrency)
+        return self._iterate(chunks)
+
+    async def read_nodes_as_table(
+        self,
+        properties: Optional[List[str]] = None,
+        *,
+        labels: Optional[List[str]] = None,
+        concurrency: int = 4,
+    ) -> pa.Table:
+        return await self._run(self.client.read_nodes_as_table, properties, labels=labels, concurrency=concurrency)
+
+    async def read_nodes_into(
+        self,
+        sink: Union[str, pa.NativeFile],
+        properties: Optional[List[str]] = None,
+        *,
+        labels: Optional[List[str]] = None,
+        concurrency: int = 4,
+    ) -> int:
+        return await self._run(self.client.read_nodes_into, sink, properties, labels=labels, concurrency=concurrency)
+
+    async def abort(self, name: Optional[str] = None) -> bool:
+        return await self._run(self.client.abort, name)
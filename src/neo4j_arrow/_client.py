@@ -1,5 +1,13 @@
+import contextlib
+import functools
+import itertools
 import logging
+import queue
+import random
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 import json
 
@@ -7,25 +15,172 @@ import pyarrow as pa
 import pyarrow.flight as flight
 
 from . import error
-from .model import Graph
+from .model import Edge, Graph, Node
 
 from typing import (
     Any,
     Callable,
+    ClassVar,
     Dict,
     Generator,
     Iterable,
+    Iterator,
     List,
+    NamedTuple,
     Optional,
     Union,
     Tuple,
+    TypeVar,
 )
 
+T = TypeVar("T")
 Result = Tuple[int, int]
 Arrow = Union[pa.Table, pa.RecordBatch]
-Nodes = Union[pa.Table, pa.RecordBatch, Iterable[pa.RecordBatch]]
-Edges = Union[pa.Table, pa.RecordBatch, Iterable[pa.RecordBatch]]
+Nodes = Union[pa.Table, pa.RecordBatch, pa.RecordBatchReader, Iterable[pa.RecordBatch]]
+Edges = Union[pa.Table, pa.RecordBatch, pa.RecordBatchReader, Iterable[pa.RecordBatch]]
 MappingFn = Callable[[Arrow], Arrow]
+PlanKey = Tuple[Any, Tuple[str, ...], Tuple[pa.DataType, ...]]
+ConstantColumns = Dict[Tuple[str, pa.DataType], pa.Array]
+PooledClient = Tuple[flight.FlightClient, flight.FlightCallOptions, Optional[Tuple[bytes, bytes]]]
+
+try:
+    # orjson is optional, but much faster than the standard library at
+    # encoding and decoding the JSON messages sent with every Flight call.
+    import orjson
+
+    _dumps: Callable[[Any], bytes] = orjson.dumps
+    _loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _loads = json.loads
+
+
+@functools.lru_cache(maxsize=128)
+def _encode_name(name: str, entity_type: Optional[str] = None) -> bytes:
+    """
+    Encode the small JSON body naming a graph (and for uploads, the entity
+    type), which is sent over and over again during an import.
+    """
+    if entity_type:
+        return _dumps({"name": name, "entity_type": entity_type})
+    return _dumps({"name": name})
+
+
+@functools.lru_cache(maxsize=32)
+def _upload_descriptor(name: str, entity_type: str) -> flight.FlightDescriptor:
+    """
+    Build the (immutable) descriptor for uploading entities of a type to a
+    graph or database, reused by every upload stream of an import.
+    """
+    return flight.FlightDescriptor.for_command(_encode_name(name, entity_type))
+
+
+@functools.lru_cache(maxsize=32)
+def _encode_ticket(
+    graph_name: str,
+    database_name: str,
+    procedure_name: str,
+    configuration: Tuple[Tuple[str, Any], ...],
+    concurrency: int,
+) -> bytes:
+    """
+    Encode the JSON ticket for streaming from a graph projection. Tuples in
+    the (hashable) configuration are encoded as lists, so repeated reads
+    with the same parameters reuse the same bytes.
+    """
+    return _dumps(
+        {
+            "graph_name": graph_name,
+            "database_name": database_name,
+            "procedure_name": procedure_name,
+            "configuration": {key: list(value) if isinstance(value, tuple) else value for key, value in configuration},
+            "concurrency": concurrency,
+        }
+    )
+
+
+def _constant_column(value: str, length: int, type: pa.DataType, cache: Optional[ConstantColumns] = None) -> pa.Array:
+    """
+    Build a column repeating a single string value, either plainly or as a
+    dictionary array with a one-entry dictionary, without going through a
+    Python list. Arrays are immutable, so consecutive batches of the same
+    length share one: the given cache keeps the last column built per value
+    and type, and lives only as long as its owner (e.g. a mapping function).
+    """
+    key = (value, type)
+    column = cache.get(key) if cache is not None else None
+    if column is not None and len(column) == length:
+        return column
+    if pa.types.is_dictionary(type):
+        indices = pa.repeat(pa.scalar(0, type.index_type), length)
+        column = pa.DictionaryArray.from_arrays(indices, pa.array([value], type.value_type))
+    else:
+        column = pa.repeat(pa.scalar(value, type), length)
+    if cache is not None:
+        cache[key] = column
+    return column
+
+
+GrpcOptions = Dict[str, Union[int, str]]
+
+# Soft limit on the serialized size of a batch sent to the server. Larger
+# batches are split before being sent.
+DEFAULT_WRITE_SIZE_LIMIT_BYTES = 4 * 1024 * 1024
+
+# Errors raised by PyArrow and Flight calls, which error.interpret() classifies.
+# Anything else is a bug on our side and propagates as is.
+_FLIGHT_ERRORS = (flight.FlightError, pa.ArrowException)
+
+# Number of chunks read ahead of the caller when streaming from the server.
+PREFETCH_CHUNKS = 8
+
+# How many idle connections the pool keeps per set of connection settings;
+# connections released beyond that are closed.
+MAX_POOLED_CLIENTS = 16
+
+# Newer PyArrow versions can select and rename the columns of a RecordBatch
+# (like a Table's) without validating and rebuilding it from its arrays.
+_BATCH_PROJECTION = all(
+    hasattr(pa.RecordBatch, method) for method in ("select", "rename_columns", "add_column", "set_column")
+)
+_END_OF_STREAM = object()
+
+# Channel arguments passed to gRPC, which can be overridden per client. The
+# local subchannel pool makes copies of a client each open their own TCP
+# connection instead of sharing one.
+DEFAULT_GRPC_OPTIONS: GrpcOptions = {
+    "grpc.use_local_subchannel_pool": 1,
+    "grpc.max_receive_message_length": -1,
+    "grpc.max_send_message_length": -1,
+    "grpc.http2.max_frame_size": 16_777_215,
+}
+
+
+class _SharedIterator(Iterator[T]):
+    """
+    An iterator several threads can safely pull from at once.
+    """
+
+    def __init__(self, items: Iterable[T]):
+        self._source = iter(items)
+        self._lock = threading.Lock()
+
+    def __next__(self) -> T:
+        with self._lock:
+            return next(self._source)
+
+
+class Plan(NamedTuple):
+    """How to map batches of a given schema for a given Node or Edge."""
+
+    indices: List[int]  # source columns, in order
+    names: List[str]  # new names of the source columns
+    schema: pa.Schema  # target schema
+    constant_position: int  # position of the constant column, or -1
+    encode_position: int  # position of a column to dictionary-encode, or -1
 
 
 class ClientState(Enum):
@@ -55,7 +210,48 @@ def procedure_names(version: Optional[str] = None) -> ProcedureNames:
         return names
 
 
+def _slot_names(cls: type) -> Tuple[str, ...]:
+    """
+    Collect the `__slots__` declared by a class and all of its bases, as
+    `cls.__slots__` only names the class's own.
+    """
+    names: List[str] = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        names.extend([slots] if isinstance(slots, str) else slots)
+    return tuple(dict.fromkeys(name for name in names if name not in ("__dict__", "__weakref__")))
+
+
 class Neo4jArrowClient:
+    __slots__ = (
+        "host",
+        "port",
+        "database",
+        "graph",
+        "user",
+        "password",
+        "tls",
+        "disable_server_verification",
+        "concurrency",
+        "timeout",
+        "max_chunk_size",
+        "write_size_limit_bytes",
+        "grpc_options",
+        "dictionary_encode",
+        "compression",
+        "socket_path",
+        "max_retries",
+        "retry_backoff",
+        "retry_backoff_max",
+        "debug",
+        "client",
+        "call_opts",
+        "auth_header",
+        "logger",
+        "state",
+        "proc_names",
+    )
+
     host: str
     port: int
     database: str
@@ -63,14 +259,30 @@ class Neo4jArrowClient:
     user: str
     password: str
     tls: bool
+    disable_server_verification: bool
     concurrency: int
     timeout: Optional[float]
     max_chunk_size: int
+    write_size_limit_bytes: Optional[int]
+    grpc_options: GrpcOptions
+    dictionary_encode: bool
+    compression: Optional[str]
+    socket_path: Optional[str]
+    max_retries: int
+    retry_backoff: float
+    retry_backoff_max: float
     debug: bool
     client: flight.FlightClient
     call_opts: flight.FlightCallOptions
+    auth_header: Optional[Tuple[bytes, bytes]]
     logger: logging.Logger
 
+    # Authenticated FlightClients (with their call options and auth token)
+    # released by client instances, shared by all instances with the same
+    # connection settings.
+    _pool: ClassVar[Dict[Tuple[Any, ...], List[PooledClient]]] = {}
+    _pool_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(
         self,
         host: str,
@@ -81,9 +293,18 @@ class Neo4jArrowClient:
         user: str = "neo4j",
         password: str = "neo4j",
         tls: bool = True,
+        disable_server_verification: bool = False,
         concurrency: int = 4,
         timeout: Optional[float] = None,
         max_chunk_size: int = 10_000,
+        write_size_limit_bytes: Optional[int] = DEFAULT_WRITE_SIZE_LIMIT_BYTES,
+        grpc_options: Optional[GrpcOptions] = None,
+        dictionary_encode: bool = False,
+        compression: Optional[str] = None,
+        socket_path: Optional[str] = None,
+        max_retries: int = 10,
+        retry_backoff: float = 0.1,
+        retry_backoff_max: float = 5.0,
         debug: bool = False,
         logger: Optional[logging.Logger] = None,
         proc_names: Optional[ProcedureNames] = None,
@@ -93,8 +314,10 @@ class Neo4jArrowClient:
         self.user = user
         self.password = password
         self.tls = tls
+        self.disable_server_verification = disable_server_verification
         self.client = None
         self.call_opts = None
+        self.auth_header = None
         self.graph = graph
         self.database = database
         self.concurrency = concurrency
@@ -102,6 +325,16 @@ class Neo4jArrowClient:
         self.debug = debug
         self.timeout = timeout
         self.max_chunk_size = max_chunk_size
+        self.write_size_limit_bytes = write_size_limit_bytes
+        self.grpc_options = dict(DEFAULT_GRPC_OPTIONS, **(grpc_options or {}))
+        self.dictionary_encode = dictionary_encode
+        if compression and not pa.Codec.is_available(compression):
+            raise ValueError(f"compression codec {compression} is not available")
+        self.compression = compression
+        self.socket_path = socket_path
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.retry_backoff_max = retry_backoff_max
         if not logger:
             logger = logging.getLogger("Neo4jArrowClient")
         self.logger = logger
@@ -118,78 +351,323 @@ class Neo4jArrowClient:
         )
 
     def __getstate__(self) -> Dict[str, Any]:
-        state = self.__dict__.copy()
-        # Remove the FlightClient and CallOpts as they're not serializable
-        if "client" in state:
-            del state["client"]
-        if "call_opts" in state:
-            del state["call_opts"]
+        # Leave out the FlightClient and CallOpts as they're not serializable
+        state = {k: getattr(self, k) for k in _slot_names(type(self)) if k not in ("client", "call_opts")}
+        state.update(getattr(self, "__dict__", {}))  # attributes of subclasses without __slots__
         return state
 
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.auth_header = None
+        for k, v in state.items():
+            setattr(self, k, v)
+        self.client = None
+        self.call_opts = None
+
     def copy(self) -> "Neo4jArrowClient":
-        client = Neo4jArrowClient(
-            self.host,
-            self.graph,
-            port=self.port,
-            database=self.database,
-            user=self.user,
-            password=self.password,
-            tls=self.tls,
-            concurrency=self.concurrency,
-            timeout=self.timeout,
-            max_chunk_size=self.max_chunk_size,
-            debug=self.debug,
-        )
-        client.state = self.state
+        """
+        Create a new, not yet connected client with the same configuration and
+        state. Copying the attributes directly skips re-validating arguments in
+        the constructor and can't miss newly added options.
+        """
+        client = object.__new__(type(self))
+        client.__setstate__(self.__getstate__())
         return client
 
+    def _expect_state(self, state: ClientState) -> None:
+        """
+        In debug mode, check the client is in the expected state. Unlike an
+        assert statement, this still runs under `python -O`.
+        """
+        if self.debug and self.state != state:
+            raise AssertionError(f"expected client state {state}, found {self.state}")
+
     def _client(self) -> flight.FlightClient:
         """
         Lazy client construction to help pickle this class because a PyArrow
         FlightClient is not serializable.
         """
         if not hasattr(self, "client") or not self.client:
+            with self._pool_lock:
+                pooled = self._pool.get(self._pool_key())
+                if pooled:
+                    self.client, self.call_opts, self.auth_header = pooled.pop()
+                    return self.client
+
             self.call_opts = None
-            if self.tls:
-                location = flight.Location.for_grpc_tls(self.host, self.port)
-            else:
-                location = flight.Location.for_grpc_tcp(self.host, self.port)
-            client = flight.FlightClient(location)
-            if self.user and self.password:
-                try:
-                    (header, token) = client.authenticate_basic_token(self.user, self.password)
-                    if header:
-                        self.call_opts = flight.FlightCallOptions(
-                            headers=[(header, token)],
-                            timeout=self.timeout,
-                        )
-                except flight.FlightUnavailableError as e:
-                    raise error.interpret(e)
+            client = flight.FlightClient(
+                self._location(),
+                write_size_limit_bytes=self.write_size_limit_bytes,
+                disable_server_verification=self.tls and self.disable_server_verification,
+                generic_options=list(self.grpc_options.items()),
+            )
+            headers = self._auth_headers(client)
+            if headers or self.compression:
+                self.call_opts = flight.FlightCallOptions(
+                    headers=headers,
+                    timeout=self.timeout,
+                    write_options=pa.ipc.IpcWriteOptions(compression=self.compression) if self.compression else None,
+                )
             self.client = client
         return self.client
 
-    def _send_action(self, action: str, body: Dict[str, Any]) -> Dict[str, Any]:
+    def _location(self) -> flight.Location:
+        if self.socket_path:
+            return flight.Location.for_grpc_unix(self.socket_path)
+        if self.tls:
+            return flight.Location.for_grpc_tls(self.host, self.port)
+        return flight.Location.for_grpc_tcp(self.host, self.port)
+
+    def _auth_headers(self, client: flight.FlightClient) -> List[Tuple[bytes, bytes]]:
         """
-        Communicates an Arrow Action message to the GDS Arrow Service.
+        Authenticate a new FlightClient (if credentials are set), returning the
+        headers to send with each call. A token from an earlier connection
+        (e.g. before this client was pickled and sent to a worker) is reused to
+        skip a round trip.
+        """
+        if not (self.user and self.password):
+            return []
+        if not self.auth_header:
+            try:
+                (header, token) = client.authenticate_basic_token(self.user, self.password)
+                if header:
+                    self.auth_header = (header, token)
+            except flight.FlightUnavailableError as e:
+                raise error.interpret(e)
+        return [self.auth_header] if self.auth_header else []
+
+    def reauthenticate(self) -> None:
+        """
+        Forget the cached authentication token (e.g. once it has expired) and
+        close the current connection, so the next call authenticates again.
+        Pooled connections with the same settings carry the same token, so
+        they get closed too.
+        """
+        with self._pool_lock:
+            stale = self._pool.pop(self._pool_key(), [])
+        for client, _, _ in stale:
+            client.close()
+        self.auth_header = None
+        if self.client:
+            self.client.close()
+        self.client = None
+        self.call_opts = None
+
+    def _pool_key(self) -> Tuple[Any, ...]:
+        return (
+            self.host,
+            self.port,
+            self.user,
+            self.password,
+            self.tls,
+            self.disable_server_verification,
+            self.timeout,
+            self.write_size_limit_bytes,
+            self.compression,
+            self.socket_path,
+            tuple(sorted(self.grpc_options.items())),
+        )
+
+    def _release(self) -> None:
+        """
+        Hand this instance's connected and authenticated FlightClient over to
+        the shared pool, so other instances (e.g. copies made for parallel
+        uploads) can reuse it instead of connecting and authenticating again.
+        """
+        if getattr(self, "client", None):
+            with self._pool_lock:
+                pooled = self._pool.setdefault(self._pool_key(), [])
+                if len(pooled) < MAX_POOLED_CLIENTS:
+                    pooled.append((self.client, self.call_opts, self.auth_header))
+                    self.client = None
+            self._discard()
+
+    def _discard(self) -> None:
+        """
+        Close this instance's FlightClient (if any) instead of pooling it.
+        """
+        if getattr(self, "client", None):
+            self.client.close()
+        self.client = None
+        self.call_opts = None
+
+    @contextlib.contextmanager
+    def _borrow_copy(self) -> Generator["Neo4jArrowClient", None, None]:
+        """
+        Provide a copy of this client whose connection is released to the pool
+        if the block succeeds, and closed if it fails (or, for a generator, is
+        closed early), so only connections that didn't fail get reused.
+        """
+        client = self.copy()
+        try:
+            yield client
+        except BaseException:
+            client._discard()
+            raise
+        client._release()
+
+    @classmethod
+    def close_pool(cls) -> None:
+        """
+        Close all pooled connections, e.g. before shutting down or once the
+        server they point at is gone.
+        """
+        with cls._pool_lock:
+            pooled = [client for clients in cls._pool.values() for client, _, _ in clients]
+            cls._pool.clear()
+        for client in pooled:
+            client.close()
+
+    def _send_action(self, action: str, body: Union[Dict[str, Any], bytes]) -> Dict[str, Any]:
+        """
+        Communicates an Arrow Action message to the GDS Arrow Service. The body
+        may be given already encoded as JSON bytes.
         """
         client = self._client()
         try:
-            payload = json.dumps(body).encode("utf-8")
+            payload = body if isinstance(body, bytes) else _dumps(body)
             result = client.do_action(flight.Action(action, payload), self.call_opts)
-            obj = json.loads(next(result).body.to_pybytes().decode())
+            obj = _loads(next(result).body.to_pybytes())
             return dict(obj)
-        except Exception as e:
+        except _FLIGHT_ERRORS as e:
             raise error.interpret(e)
 
-    def _get_chunks(self, ticket: Dict[str, Any]) -> Generator[Arrow, None, None]:
+    def _get_chunks(self, ticket: bytes) -> Generator[Arrow, None, None]:
+        """
+        Stream the chunks for a ticket. Chunks are read ahead by a background
+        thread (up to PREFETCH_CHUNKS of them) so receiving data overlaps with
+        the caller processing it.
+        """
         client = self._client()
         try:
-            result = client.do_get(pa.flight.Ticket(json.dumps(ticket).encode("utf8")), self.call_opts)
-            for chunk, _ in result:
-                yield chunk
-        except Exception as e:
+            result = client.do_get(pa.flight.Ticket(ticket), self.call_opts)
+        except _FLIGHT_ERRORS as e:
+            raise error.interpret(e)
+
+        try:
+            yield from self._read_ahead([(chunk.data for chunk in result)], PREFETCH_CHUNKS, result.cancel)
+        except _FLIGHT_ERRORS as e:
             raise error.interpret(e)
 
+    def _get_table(self, ticket: bytes) -> pa.Table:
+        """
+        Read all chunks for a ticket into a single Table.
+        """
+        client = self._client()
+        try:
+            return client.do_get(pa.flight.Ticket(ticket), self.call_opts).read_all()
+        except _FLIGHT_ERRORS as e:
+            raise error.interpret(e)
+
+    def _get_into(self, sink: Union[str, pa.NativeFile], ticket: bytes) -> int:
+        """
+        Copy the chunks for a ticket into an Arrow IPC stream written to
+        `sink`, returning the number of rows.
+        """
+        client = self._client()
+        n_rows = 0
+        try:
+            result = client.do_get(pa.flight.Ticket(ticket), self.call_opts)
+            with pa.ipc.new_stream(sink, result.schema) as writer:
+                for chunk in result:
+                    writer.write_batch(chunk.data)
+                    n_rows += chunk.data.num_rows
+        except _FLIGHT_ERRORS as e:
+            raise error.interpret(e)
+        return n_rows
+
+    def _get_table_in_parallel(self, tickets: List[bytes]) -> pa.Table:
+        """
+        Read the chunks for several tickets at once into a single Table, each
+        using its own copy of this client (and its own connection).
+        """
+
+        def _read(ticket: bytes) -> pa.Table:
+            with self._borrow_copy() as client:
+                return client._get_table(ticket)
+
+        with ThreadPoolExecutor(max_workers=len(tickets)) as pool:
+            tables = list(pool.map(_read, tickets))
+        return pa.concat_tables(tables)
+
+    @classmethod
+    def _read_ahead(
+        cls, sources: List[Iterable[T]], size: int, cancel: Optional[Callable[[], None]] = None
+    ) -> Generator[T, None, None]:
+        """
+        Iterate over the items of one or more sources, each on its own
+        background thread, buffering up to `size` items so producing them
+        overlaps with the caller consuming them. Items from several sources
+        are interleaved in the order they are produced. Errors raised while
+        producing are re-raised to the caller. If the caller stops early,
+        `cancel` (if given) is called and sources that are generators get
+        closed.
+        """
+        buffer: "queue.Queue[Any]" = queue.Queue(maxsize=size)
+        stopped = threading.Event()
+        for source in sources:
+            threading.Thread(target=cls._produce, args=(source, buffer, stopped), daemon=True).start()
+        yield from cls._consume(buffer, stopped, len(sources), cancel)
+
+    @classmethod
+    def _produce(cls, source: Iterable[T], buffer: "queue.Queue[Any]", stopped: threading.Event) -> None:
+        """
+        Producer thread of _read_ahead: put the items of a source into the
+        buffer, followed by an end marker (or the error raised producing them).
+        """
+        try:
+            for item in source:
+                if not cls._put(buffer, stopped, item):
+                    return
+            cls._put(buffer, stopped, _END_OF_STREAM)
+        except Exception as e:
+            cls._put(buffer, stopped, e)
+        finally:
+            close = getattr(source, "close", None)
+            if stopped.is_set() and close:
+                close()
+
+    @classmethod
+    def _put(cls, buffer: "queue.Queue[Any]", stopped: threading.Event, item: Any) -> bool:
+        # Don't block forever on a full buffer once the caller is gone.
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    @classmethod
+    def _consume(
+        cls,
+        buffer: "queue.Queue[Any]",
+        stopped: threading.Event,
+        remaining: int,
+        cancel: Optional[Callable[[], None]] = None,
+    ) -> Generator[Any, None, None]:
+        """
+        Consumer side of _read_ahead: yield buffered items until all
+        `remaining` producers have finished, re-raising their errors.
+        """
+        try:
+            while remaining:
+                item = buffer.get()
+                if item is _END_OF_STREAM:
+                    remaining -= 1
+                    continue
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            if remaining:
+                # The caller stopped early (or a source failed): stop and
+                # cancel the producers and drop whatever they buffered.
+                stopped.set()
+                if cancel:
+                    cancel()
+                while not buffer.empty():
+                    buffer.get_nowait()
+
     @classmethod
     def _nop(cls, data: Arrow) -> Arrow:
         """
@@ -198,123 +676,365 @@ class Neo4jArrowClient:
         return data
 
     @classmethod
-    def _node_mapper(cls, model: Graph, source_field: Optional[str] = None) -> MappingFn:
+    def _node_mapper(
+        cls, model: Graph, source_field: Optional[str] = None, dictionary_encode: bool = False
+    ) -> MappingFn:
         """
-        Generate a mapping function for a Node.
+        Generate a mapping function for a Node. Optionally, string labels are
+        dictionary-encoded.
         """
+        plans: Dict[PlanKey, Plan] = {}
+        source_key = source_field.encode("utf8") if source_field else b""
+        nodes: Dict[Any, Optional[Node]] = {}  # by source or label
+        constants: ConstantColumns = {}  # label columns, shared by batches of equal length
 
-        def _map(data: Arrow) -> Arrow:
+        def _plan(data: Arrow) -> Tuple[Node, Plan]:
             schema = data.schema
             if source_field:
-                src = schema.metadata.get(source_field.encode("utf8"))
-                node = model.node_for_src(src.decode("utf8"))
+                src = schema.metadata.get(source_key)
+                if src not in nodes:
+                    nodes[src] = model.node_for_src(src.decode("utf8"))
+                node = nodes[src]
             else:  # guess at labels
                 my_label = data["labels"][0].as_py()
-                node = model.node_by_label(my_label)
+                if my_label not in nodes:
+                    nodes[my_label] = model.node_by_label(my_label)
+                node = nodes[my_label]
             if not node:
                 raise Exception("cannot find matching node in model given " f"{data.schema}")
 
-            columns, fields = cls._rename_and_add_column([], [], data, node.key_field, "nodeId")
-            if node.label:
-                columns.append(pa.array([node.label] * len(data), pa.string()))
-                fields.append(pa.field("labels", pa.string()))
-            if node.label_field:
-                columns, fields = cls._rename_and_add_column(columns, fields, data, node.label_field, "labels")
-            for name in node.properties:
-                columns, fields = cls._rename_and_add_column(columns, fields, data, name, node.properties[name])
+            key = (node, tuple(schema.names), tuple(schema.types))
+            plan = plans.get(key)
+            if plan is None:
+                renames = [(node.key_field, "nodeId")]
+                if node.label_field:
+                    renames.append((node.label_field, "labels"))
+                renames.extend(node.properties.items())
+                plan = plans[key] = cls._mapping_plan(
+                    schema,
+                    renames,
+                    (1, "labels") if node.label else None,
+                    "labels" if dictionary_encode else "",
+                )
+            return node, plan
+
+        # With a source field, the node (and so the plan) only depends on the schema.
+        plan_for = cls._reuse_for_same_schema(_plan) if source_field else _plan
 
-            return data.from_arrays(columns, schema=pa.schema(fields))
+        def _map(data: Arrow) -> Arrow:
+            node, plan = plan_for(data)
+            return cls._apply_plan(data, plan, node.label, constants)
 
         return _map
 
     @classmethod
-    def _edge_mapper(cls, model: Graph, source_field: Optional[str] = None) -> MappingFn:
+    def _edge_mapper(
+        cls, model: Graph, source_field: Optional[str] = None, dictionary_encode: bool = False
+    ) -> MappingFn:
         """
-        Generate a mapping function for an Edge.
+        Generate a mapping function for an Edge. Optionally, string
+        relationship types are dictionary-encoded.
         """
+        plans: Dict[PlanKey, Plan] = {}
+        source_key = source_field.encode("utf8") if source_field else b""
+        edges: Dict[Any, Optional[Edge]] = {}  # by source or type
+        constants: ConstantColumns = {}  # type columns, shared by batches of equal length
 
-        def _map(data: Arrow) -> Arrow:
+        def _plan(data: Arrow) -> Tuple[Edge, Plan]:
             schema = data.schema
             if source_field:
-                src = schema.metadata.get(source_field.encode("utf8"))
-                edge = model.edge_for_src(src.decode("utf8"))
+                src = schema.metadata.get(source_key)
+                if src not in edges:
+                    edges[src] = model.edge_for_src(src.decode("utf8"))
+                edge = edges[src]
             else:  # guess at type
                 my_type = data["type"][0].as_py()
-                edge = model.edge_by_type(my_type)
+                if my_type not in edges:
+                    edges[my_type] = model.edge_by_type(my_type)
+                edge = edges[my_type]
             if not edge:
                 raise Exception("cannot find matching edge in model given " f"{data.schema}")
 
-            columns, fields = cls._rename_and_add_column([], [], data, edge.source_field, "sourceNodeId")
-            columns, fields = cls._rename_and_add_column(columns, fields, data, edge.target_field, "targetNodeId")
-            if edge.type:
-                columns.append(pa.array([edge.type] * len(data), pa.string()))
-                fields.append(pa.field("relationshipType", pa.string()))
-            if edge.type_field:
-                columns, fields = cls._rename_and_add_column(columns, fields, data, edge.type_field, "relationshipType")
-            for name in edge.properties:
-                columns, fields = cls._rename_and_add_column(columns, fields, data, name, edge.properties[name])
+            key = (edge, tuple(schema.names), tuple(schema.types))
+            plan = plans.get(key)
+            if plan is None:
+                renames = [(edge.source_field, "sourceNodeId"), (edge.target_field, "targetNodeId")]
+                if edge.type_field:
+                    renames.append((edge.type_field, "relationshipType"))
+                renames.extend(edge.properties.items())
+                plan = plans[key] = cls._mapping_plan(
+                    schema,
+                    renames,
+                    (2, "relationshipType") if edge.type else None,
+                    "relationshipType" if dictionary_encode else "",
+                )
+            return edge, plan
+
+        # With a source field, the edge (and so the plan) only depends on the schema.
+        plan_for = cls._reuse_for_same_schema(_plan) if source_field else _plan
 
-            return data.from_arrays(columns, schema=pa.schema(fields))
+        def _map(data: Arrow) -> Arrow:
+            edge, plan = plan_for(data)
+            return cls._apply_plan(data, plan, edge.type, constants)
 
         return _map
 
     @classmethod
-    def _rename_and_add_column(
+    def _reuse_for_same_schema(cls, fn: Callable[[Arrow], T]) -> Callable[[Arrow], T]:
+        """
+        Wrap a function that only depends on the schema (including metadata) of
+        its argument, reusing the last result for as long as consecutive
+        batches share the same schema. Comparing schemas happens entirely in
+        Arrow, so a stream of uniform batches skips all Python-level lookups.
+        """
+        last: Optional[Tuple[pa.Schema, T]] = None
+
+        def _wrapped(data: Arrow) -> T:
+            nonlocal last
+            schema, cached = data.schema, last  # may be shared by uploading threads
+            if cached is not None and schema.equals(cached[0], check_metadata=True):
+                return cached[1]
+            result = fn(data)
+            last = (schema, result)
+            return result
+
+        return _wrapped
+
+    @classmethod
+    def _mapping_plan(
         cls,
-        columns: List[Union[pa.Array, pa.ChunkedArray]],
-        fields: List[pa.Field],
-        data: Arrow,
-        current_name: str,
-        new_name: str,
-    ) -> Tuple[List[Union[pa.Array, pa.ChunkedArray]], List[pa.Field]]:
-        idx = data.schema.get_field_index(current_name)
-        columns.append(data.columns[idx])
-        fields.append(data.schema.field(idx).with_name(new_name))
-        return columns, fields
+        schema: pa.Schema,
+        renames: List[Tuple[str, str]],
+        constant: Optional[Tuple[int, str]] = None,
+        encode: str = "",
+    ) -> Plan:
+        """
+        Compute the source column indices and the target schema for renaming
+        fields of the given schema. If provided, `constant` is the position and
+        name of an additional string field filled in with a constant value.
+        A string field named `encode` (renamed or constant) gets
+        dictionary-encoded.
+        """
+        index = {name: idx for idx, name in enumerate(schema.names)}
+        missing = [current_name for current_name, _ in renames if current_name not in index]
+        if missing:
+            raise Exception(f"cannot find fields {missing} in {schema}")
+        indices = [index[current_name] for current_name, _ in renames]
+        fields = [schema.field(idx).with_name(new_name) for idx, (_, new_name) in zip(indices, renames)]
+        constant_position = -1
+        if constant:
+            constant_position, name = constant
+            fields.insert(constant_position, pa.field(name, pa.string()))
+
+        encode_position = -1
+        for i, field in enumerate(fields):
+            is_string = pa.types.is_string(field.type) or pa.types.is_large_string(field.type)
+            if field.name == encode and is_string:
+                if i != constant_position:
+                    encode_position = i
+                fields[i] = field.with_type(pa.dictionary(pa.int32(), field.type))
+        names = [new_name for _, new_name in renames]
+        return Plan(indices, names, pa.schema(fields), constant_position, encode_position)
+
+    @classmethod
+    def _apply_plan(
+        cls, data: Arrow, plan: Plan, constant: str = "", constants: Optional[ConstantColumns] = None
+    ) -> Arrow:
+        """
+        Select and rename the columns of a Table or RecordBatch according to a
+        mapping plan, adding the plan's constant column (if any) with the given
+        value. Constant columns are reused from, and kept in, `constants`.
+        """
+        indices, names, target_schema, constant_position, encode_position = plan
+        if _BATCH_PROJECTION or isinstance(data, pa.Table):
+            # Renaming and adding columns only touches the data's metadata.
+            result = data.select(indices).rename_columns(names).replace_schema_metadata()
+            if constant_position >= 0:
+                field = target_schema.field(constant_position)
+                column = _constant_column(constant, len(data), field.type, constants)
+                result = result.add_column(constant_position, field, column)
+            if encode_position >= 0:
+                field = target_schema.field(encode_position)
+                result = result.set_column(encode_position, field, result.column(encode_position).dictionary_encode())
+            return result
+
+        columns = [data.column(i) for i in indices]
+        if constant_position >= 0:
+            field = target_schema.field(constant_position)
+            columns.insert(constant_position, _constant_column(constant, len(data), field.type, constants))
+        if encode_position >= 0:
+            columns[encode_position] = columns[encode_position].dictionary_encode()
+        return data.from_arrays(columns, schema=target_schema)
 
     def _write_batches(
         self,
         desc: Dict[str, Any],
-        batches: List[pa.RecordBatch],
+        batches: Iterable[pa.RecordBatch],
         mapping_fn: Optional[MappingFn] = None,
+        max_rows: Optional[int] = None,
     ) -> Result:
         """
-        Write PyArrow RecordBatches to the GDS Flight service.
+        Write PyArrow RecordBatches to the GDS Flight service. Runs of small
+        batches are combined into batches of up to `max_rows` rows (defaulting
+        to `max_chunk_size`).
         """
-        if len(batches) == 0:
+        batches = iter(batches)
+        first = next(batches, None)
+        if first is None:
             raise Exception("no record batches provided")
 
-        fn = mapping_fn or self._nop
-        schema = fn(batches[0]).schema
+        # The first batch is mapped here to learn the upload schema, and not again.
+        first = mapping_fn(first) if mapping_fn else first
+        schema = first.schema
 
         client = self._client()
-        upload_descriptor = flight.FlightDescriptor.for_command(json.dumps(desc).encode("utf-8"))
+        upload_descriptor = _upload_descriptor(desc["name"], desc["entity_type"])
         n_rows, n_bytes = 0, 0
+        # Map and coalesce batches on a background thread, overlapping with uploading.
+        source = itertools.chain([first], map(mapping_fn, batches) if mapping_fn else batches)
+        coalesced = self._coalesce(source, max_rows or self.max_chunk_size, self.write_size_limit_bytes)
+        ready = self._read_ahead([coalesced], self.concurrency)
         try:
             writer, metadata_reader = client.do_put(upload_descriptor, schema, self.call_opts)
+            put = self._put_batch  # bound once, outside the per-batch loop
             with writer:
-                for batch in batches:
-                    mapped_batch = fn(batch)
-                    self._write_batch_with_retries(mapped_batch, writer)
-                    metadata_reader.read() # read the ack message
+                for batch in ready:
+                    put(batch, writer, metadata_reader)
                     n_rows += batch.num_rows
-                    n_bytes += batch.get_total_buffer_size()
-        except Exception as e:
+                    n_bytes += batch.nbytes
+        except _FLIGHT_ERRORS as e:
             raise error.interpret(e)
+        finally:
+            ready.close()
         return n_rows, n_bytes
 
-    def _write_batch_with_retries(self, mapped_batch, writer):
-        num_retries = 10
+    @classmethod
+    def _coalesce(
+        cls, batches: Iterable[pa.RecordBatch], max_rows: int, max_bytes: Optional[int] = None
+    ) -> Generator[pa.RecordBatch, None, None]:
+        """
+        Combine runs of small batches into batches of up to `max_rows` rows
+        (and `max_bytes` bytes, if given), so many tiny batches don't each pay
+        for their own IPC message and ack. Batches that are big enough already
+        pass through untouched.
+
+        Like the write size limit, `max_bytes` applies to the IPC message: each
+        batch counts the size of its serialized data, and every combined batch
+        reserves the per-message metadata once.
+        """
+        limit = max_bytes or sys.maxsize
+        overhead: Optional[int] = None  # per-message metadata, measured on the first batch
+        pending: List[pa.RecordBatch] = []
+        pending_rows, pending_bytes = 0, 0
+        for batch in batches:
+            rows, size = batch.num_rows, 0
+            if max_bytes:
+                if overhead is None:
+                    overhead = pa.ipc.get_record_batch_size(batch.slice(0, 0))
+                size = pa.ipc.get_record_batch_size(batch) - overhead
+            reserved = overhead or 0
+            if pending and (pending_rows + rows > max_rows or reserved + pending_bytes + size > limit):
+                yield cls._combine(pending)
+                pending, pending_rows, pending_bytes = [], 0, 0
+            if rows >= max_rows or reserved + size >= limit:
+                yield batch
+            else:
+                pending.append(batch)
+                pending_rows += rows
+                pending_bytes += size
+        if pending:
+            yield cls._combine(pending)
+
+    @classmethod
+    def _combine(cls, batches: List[pa.RecordBatch]) -> pa.RecordBatch:
+        """
+        Concatenate batches sharing a schema into a single batch.
+        """
+        if len(batches) == 1:
+            return batches[0]
+        table = pa.Table.from_batches(batches).unify_dictionaries().combine_chunks()
+        combined = table.to_batches()
+        return combined[0] if combined else batches[0]
+
+    def _write_shards(
+        self,
+        desc: Dict[str, Any],
+        batches: Iterable[pa.RecordBatch],
+        mapping_fn: Optional[MappingFn] = None,
+        max_rows: Optional[int] = None,
+    ) -> Result:
+        """
+        Write PyArrow RecordBatches using up to `concurrency` parallel streams,
+        each using its own copy of this client (and its own connection).
+
+        Lists are split round-robin up front. Any other iterable is consumed
+        lazily: each stream pulls its next batch from the shared iterator, so
+        faster streams take on more of the work and nothing is materialized.
+        """
+        if isinstance(batches, list):
+            slices = (list(itertools.islice(batches, i, None, self.concurrency)) for i in range(self.concurrency))
+            shards: List[Iterable[pa.RecordBatch]] = [shard for shard in slices if shard]
+            if len(shards) < 2:
+                return self._write_batches(desc, batches, mapping_fn, max_rows)
+        elif self.concurrency < 2:
+            return self._write_batches(desc, batches, mapping_fn, max_rows)
+        else:
+            shared = _SharedIterator(batches)
+            shards = [shared] * self.concurrency
+
+        def _write_shard(shard: Iterable[pa.RecordBatch]) -> Optional[Result]:
+            shard = iter(shard)
+            first = next(shard, None)
+            if first is None:
+                return None  # other streams drained a shared iterator first
+            with self._borrow_copy() as client:
+                return client._write_batches(desc, itertools.chain([first], shard), mapping_fn, max_rows)
+
+        with ThreadPoolExecutor(max_workers=len(shards)) as pool:
+            results = list(pool.map(_write_shard, shards))
+        written = [result for result in results if result is not None]
+        if not written:
+            raise Exception("no record batches provided")
+        return sum(n_rows for n_rows, _ in written), sum(n_bytes for _, n_bytes in written)
+
+    def _put_batch(
+        self,
+        batch: pa.RecordBatch,
+        writer: flight.FlightStreamWriter,
+        metadata_reader: flight.FlightMetadataReader,
+    ) -> None:
+        """
+        Write a single RecordBatch to an upload stream and read the server's
+        acknowledgement. Batches exceeding the write size limit are split into
+        smaller slices, which are written individually.
+        """
+        try:
+            self._write_batch_with_retries(batch, writer)
+        except flight.FlightWriteSizeExceededError as e:
+            if batch.num_rows < 2:
+                raise e
+            pieces = -(-e.actual // e.limit)
+            rows = -(-batch.num_rows // max(pieces, 2))
+            for offset in range(0, batch.num_rows, rows):
+                self._put_batch(batch.slice(offset, rows), writer, metadata_reader)
+            return
+        metadata_reader.read()  # read the ack message
+
+    def _write_batch_with_retries(self, mapped_batch: pa.RecordBatch, writer: flight.FlightStreamWriter) -> None:
+        attempt = 0
         while True:
             try:
                 writer.write_batch(mapped_batch)
                 break
-            except flight.FlightUnavailableError | flight.FlightTimedOutError | flight.FlightInternalError as e:
-                self.logger.exception(f"Encountered transient error; retrying {num_retries} more times ...")
-                time.sleep(0.1 / num_retries)
-                num_retries -= 1
-                if num_retries == 0:
+            except (flight.FlightUnavailableError, flight.FlightTimedOutError, flight.FlightInternalError) as e:
+                if attempt >= self.max_retries:
                     raise e
+                self.logger.exception(
+                    f"Encountered transient error; retrying {self.max_retries - attempt} more times ..."
+                )
+                # exponential backoff with full jitter, so retrying clients spread out
+                time.sleep(random.uniform(0, min(self.retry_backoff_max, self.retry_backoff * 2**attempt)))
+                attempt += 1
 
     def start(
         self,
@@ -390,7 +1110,7 @@ class Neo4jArrowClient:
         """
         Start an import job. Defaults to graph (projection) import.
         """
-        assert not self.debug or self.state == ClientState.READY
+        self._expect_state(ClientState.READY)
 
         if config is None:
             config = {}
@@ -415,13 +1135,44 @@ class Neo4jArrowClient:
 
         return {}
 
-    def _write_entities(self, desc: Dict[str, Any], entities: Union[Nodes, Edges], mapper: MappingFn) -> Result:
+    def _rows_per_chunk(self, table: pa.Table) -> int:
+        """
+        Pick how many rows of a Table go into each uploaded batch: at most
+        max_chunk_size, but few enough for a batch of the Table's average row
+        width to stay under the write size limit, so wide rows don't need to
+        be split again after failing to send.
+
+        Sizes are measured as IPC messages, which is what the limit applies
+        to, so per-message metadata and padding are accounted for and slices
+        only count the data they reference.
+        """
+        if not self.write_size_limit_bytes or table.num_rows == 0:
+            return self.max_chunk_size
+        batches = table.to_batches()
+        overhead = pa.ipc.get_record_batch_size(batches[0].slice(0, 0))
+        data_bytes = sum(pa.ipc.get_record_batch_size(batch) for batch in batches) - overhead * len(batches)
+        if data_bytes <= 0:
+            return self.max_chunk_size
+        row_bytes = data_bytes / table.num_rows
+        return max(1, min(self.max_chunk_size, int((self.write_size_limit_bytes - overhead) // row_bytes)))
+
+    def _write_entities(
+        self,
+        desc: Dict[str, Any],
+        entities: Union[Nodes, Edges],
+        mapper: Optional[MappingFn] = None,
+        batch_rows: Optional[int] = None,
+    ) -> Result:
         try:
             if isinstance(entities, pa.Table):
-                entities = mapper(entities).to_batches(max_chunksize=self.max_chunk_size)
-                mapper = self._nop
-
-            return self._write_batches(desc, entities, mapper)
+                # Slicing a Table is zero-copy; batches get mapped one at a time
+                # while uploading, so no mapped copy of the whole Table is made.
+                rows = batch_rows or self._rows_per_chunk(entities)
+                return self._write_shards(desc, entities.to_batches(max_chunksize=rows), mapper, rows)
+            if isinstance(entities, pa.RecordBatch):
+                return self._write_batches(desc, [entities], mapper, batch_rows)
+
+            return self._write_shards(desc, entities, mapper, batch_rows)
         except error.NotFound as e:
             self.logger.error(f"no existing import job found for graph f{self.graph}")
             raise e
@@ -434,58 +1185,61 @@ class Neo4jArrowClient:
         nodes: Nodes,
         model: Optional[Graph] = None,
         source_field: Optional[str] = None,
+        batch_rows: Optional[int] = None,
     ) -> Result:
-        assert not self.debug or self.state == ClientState.FEEDING_NODES
+        """
+        Write nodes to the current import. Tables are split into batches of at
+        most `batch_rows` rows (defaulting to `max_chunk_size`).
+        """
+        self._expect_state(ClientState.FEEDING_NODES)
         desc = {"name": self.graph, "entity_type": "node"}
+        mapper: Optional[MappingFn] = None
         if model:
             model.validate()
-            mapper = self._node_mapper(model, source_field)
-        else:
-            mapper = self._nop
+            mapper = self._node_mapper(model, source_field, self.dictionary_encode)
 
-        return self._write_entities(desc, nodes, mapper)
+        return self._write_entities(desc, nodes, mapper, batch_rows)
 
     def nodes_done(self) -> Dict[str, Any]:
-        assert not self.debug or self.state == ClientState.FEEDING_NODES
+        self._expect_state(ClientState.FEEDING_NODES)
 
-        try:
-            result = self._send_action("NODE_LOAD_DONE", {"name": self.graph})
-            if result and result.get("name", None) == self.graph:
-                self.state = ClientState.FEEDING_EDGES
-                return result
+        result = self._send_action("NODE_LOAD_DONE", _encode_name(self.graph))
+        if result and result.get("name", None) == self.graph:
+            self.state = ClientState.FEEDING_EDGES
+            return result
 
-            raise error.Neo4jArrowException(f"invalid response for nodes_done for graph {self.graph}, got {result}")
-        except Exception as e:
-            raise error.interpret(e)
+        raise error.Neo4jArrowException(f"invalid response for nodes_done for graph {self.graph}, got {result}")
 
     def write_edges(
         self,
         edges: Edges,
         model: Optional[Graph] = None,
         source_field: Optional[str] = None,
+        batch_rows: Optional[int] = None,
     ) -> Result:
-        assert not self.debug or self.state == ClientState.FEEDING_EDGES
+        """
+        Write edges (relationships) to the current import. Tables are split
+        into batches of at most `batch_rows` rows (defaulting to
+        `max_chunk_size`).
+        """
+        self._expect_state(ClientState.FEEDING_EDGES)
         desc = {"name": self.graph, "entity_type": "relationship"}
+        mapper: Optional[MappingFn] = None
         if model:
             model.validate()
-            mapper = self._edge_mapper(model, source_field)
-        else:
-            mapper = self._nop
+            mapper = self._edge_mapper(model, source_field, self.dictionary_encode)
 
-        return self._write_entities(desc, edges, mapper)
+        return self._write_entities(desc, edges, mapper, batch_rows)
 
     def edges_done(self) -> Dict[str, Any]:
-        assert not self.debug or self.state == ClientState.FEEDING_EDGES
+        self._expect_state(ClientState.FEEDING_EDGES)
 
-        try:
-            result = self._send_action("RELATIONSHIP_LOAD_DONE", {"name": self.graph})
-            if result and result.get("name", None) == self.graph:
-                self.state = ClientState.AWAITING_GRAPH
-                return result
+        result = self._send_action("RELATIONSHIP_LOAD_DONE", _encode_name(self.graph))
+        if result and result.get("name", None) == self.graph:
+            self.state = ClientState.AWAITING_GRAPH
+            return result
 
-            raise error.Neo4jArrowException(f"invalid response for edges_done for graph {self.graph}, got {result}")
-        except Exception as e:
-            raise error.interpret(e)
+        raise error.Neo4jArrowException(f"invalid response for edges_done for graph {self.graph}, got {result}")
 
     def read_edges(
         self,
@@ -493,37 +1247,100 @@ class Neo4jArrowClient:
         properties: Optional[List[str]] = None,
         relationship_types: Optional[List[str]] = None,
         concurrency: int = 4,
+        streams: int = 1,
     ) -> Generator[Arrow, None, None]:
         """
         Stream edges (relationships) from a Neo4j graph projection. When
         requesting properties, they must be requested explicitly. However,
         all relationship types may be selected using the special ['*'] value.
 
+        With `streams` > 1 and several explicit relationship types, the types
+        are split over up to `streams` parallel streams, each using its own
+        connection, and their chunks are interleaved as they arrive.
+
         N.b. relationship types are dictionary-encoded.
         """
+        tickets = self._edge_tickets(properties, relationship_types, concurrency, streams)
+        if len(tickets) == 1:
+            return self._get_chunks(tickets[0])
+        return self._get_chunks_in_parallel(tickets)
+
+    def read_edges_as_table(
+        self,
+        *,
+        properties: Optional[List[str]] = None,
+        relationship_types: Optional[List[str]] = None,
+        concurrency: int = 4,
+        streams: int = 1,
+    ) -> pa.Table:
+        """
+        Read edges (relationships) into a single Table, see read_edges. Each
+        stream is collected by Arrow without handing batches to Python.
+        """
+        tickets = self._edge_tickets(properties, relationship_types, concurrency, streams)
+        if len(tickets) == 1:
+            return self._get_table(tickets[0])
+        return self._get_table_in_parallel(tickets)
+
+    def read_edges_into(
+        self,
+        sink: Union[str, pa.NativeFile],
+        *,
+        properties: Optional[List[str]] = None,
+        relationship_types: Optional[List[str]] = None,
+        concurrency: int = 4,
+    ) -> int:
+        """
+        Write edges (relationships) to `sink` (e.g. a pa.BufferOutputStream or
+        a file path) as an Arrow IPC stream, see read_edges. Returns the number
+        of edges written.
+        """
+        return self._get_into(sink, self._edge_tickets(properties, relationship_types, concurrency, 1)[0])
+
+    def _edge_tickets(
+        self,
+        properties: Optional[List[str]],
+        relationship_types: Optional[List[str]],
+        concurrency: int,
+        streams: int,
+    ) -> List[bytes]:
         if concurrency < 1:
             raise ValueError("concurrency cannot be negative")
-        if properties:
-            procedure_name = self.proc_names.edges_multiple_property
-            configuration = {
-                "relationship_properties": list(properties if properties is not None else []),
-                "relationship_types": list(relationship_types if relationship_types is not None else ["*"]),
-            }
-        else:
-            procedure_name = self.proc_names.edges_topology
-            configuration = {
-                "relationship_types": list(relationship_types if relationship_types is not None else ["*"]),
-            }
+        if streams < 1:
+            raise ValueError("streams must be positive")
+        types = tuple(relationship_types if relationship_types is not None else ["*"])
+        if "*" in types:
+            streams = 1
+        groups = [group for group in (types[i::streams] for i in range(streams)) if group]
+
+        tickets = []
+        for group in groups:
+            if properties:
+                procedure_name = self.proc_names.edges_multiple_property
+                configuration: Tuple[Tuple[str, Any], ...] = (
+                    ("relationship_properties", tuple(properties)),
+                    ("relationship_types", group),
+                )
+            else:
+                procedure_name = self.proc_names.edges_topology
+                configuration = (("relationship_types", group),)
+            tickets.append(_encode_ticket(self.graph, self.database, procedure_name, configuration, concurrency))
+        return tickets
 
-        return self._get_chunks(
-            {
-                "graph_name": self.graph,
-                "database_name": self.database,
-                "procedure_name": procedure_name,
-                "configuration": configuration,
-                "concurrency": concurrency,
-            }
-        )
+    def _get_chunks_in_parallel(self, tickets: List[bytes]) -> Generator[Arrow, None, None]:
+        """
+        Stream the chunks for several tickets at once, each using its own copy
+        of this client (and its own connection).
+        """
+
+        def _stream(ticket: bytes) -> Generator[Arrow, None, None]:
+            with self._borrow_copy() as client:
+                yield from client._get_chunks(ticket)
+
+        try:
+            yield from self._read_ahead([_stream(ticket) for ticket in tickets], PREFETCH_CHUNKS)
+        except _FLIGHT_ERRORS as e:
+            raise error.interpret(e)
 
     def read_nodes(
         self,
@@ -540,22 +1357,48 @@ class Neo4jArrowClient:
         N.b. Unlike read_edges, there's no analog to just requesting topology,
         i.e. we can't say "give me all the node ids and their labels".
         """
+        return self._get_chunks(self._node_ticket(properties, labels, concurrency))
+
+    def read_nodes_as_table(
+        self,
+        properties: Optional[List[str]] = None,
+        *,
+        labels: Optional[List[str]] = None,
+        concurrency: int = 4,
+    ) -> pa.Table:
+        """
+        Read node properties into a single Table, see read_nodes. The stream is
+        collected by Arrow without handing batches to Python.
+        """
+        return self._get_table(self._node_ticket(properties, labels, concurrency))
+
+    def read_nodes_into(
+        self,
+        sink: Union[str, pa.NativeFile],
+        properties: Optional[List[str]] = None,
+        *,
+        labels: Optional[List[str]] = None,
+        concurrency: int = 4,
+    ) -> int:
+        """
+        Write node properties to `sink` (e.g. a pa.BufferOutputStream or a
+        file path) as an Arrow IPC stream, see read_nodes. Returns the number
+        of nodes written.
+        """
+        return self._get_into(sink, self._node_ticket(properties, labels, concurrency))
+
+    def _node_ticket(self, properties: Optional[List[str]], labels: Optional[List[str]], concurrency: int) -> bytes:
         # todo: runtime validation of args so we don't send garbage
         if concurrency < 1:
             raise ValueError("concurrency cannot be negative")
 
-        return self._get_chunks(
-            {
-                "graph_name": self.graph,
-                "database_name": self.database,
-                "procedure_name": self.proc_names.nodes_multiple_property,
-                "configuration": {
-                    "node_labels": list(labels if labels is not None else ["*"]),
-                    "node_properties": list(properties if properties is not None else []),
-                    "list_node_labels": True,
-                },
-                "concurrency": concurrency,
-            }
+        configuration = (
+            ("node_labels", tuple(labels if labels is not None else ["*"])),
+            ("node_properties", tuple(properties if properties is not None else [])),
+            ("list_node_labels", True),
+        )
+        return _encode_ticket(
+            self.graph, self.database, self.proc_names.nodes_multiple_property, configuration, concurrency
         )
 
     def abort(self, name: Optional[str] = None) -> bool:
@@ -564,7 +1407,7 @@ class Neo4jArrowClient:
             "name": name or self.graph,
         }
         try:
-            result = self._send_action("ABORT", config)
+            result = self._send_action("ABORT", _encode_name(config["name"]))
             if result and result.get("name", None) == config["name"]:
                 self.state = ClientState.READY
                 return True
@@ -578,7 +1421,7 @@ class Neo4jArrowClient:
 
     def wait(self, timeout: int = 0) -> None:
         """wait for completion"""
-        assert not self.debug or self.state == ClientState.AWAITING_GRAPH
+        self._expect_state(ClientState.AWAITING_GRAPH)
         self.state = ClientState.AWAITING_GRAPH
         # TODO: return future? what do we do?
         pass
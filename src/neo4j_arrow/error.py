@@ -1,10 +1,12 @@
 """
 Neo4j Flight Service Errors
 """
+import re
+
 from pyarrow.lib import ArrowException
 from pyarrow.flight import FlightServerError
 
-from typing import Union
+from typing import Dict, Type, Union
 
 KnownExceptions = Union[ArrowException, FlightServerError, Exception]
 
@@ -14,17 +16,12 @@ def interpret(e: KnownExceptions) -> KnownExceptions:
     Try to figure out which exception occurred based on the server response.
     """
     message = "".join(e.args)
-    if "ALREADY_EXISTS" in message:
-        return AlreadyExists(message)
-    elif "INVALID_ARGUMENT" in message:
-        return InvalidArgument(message)
-    elif "NOT_FOUND" in message:
-        return NotFound(message)
-    elif "INTERNAL" in message:
-        return InternalError(message)
-    elif "UNKNOWN" in message:
-        # nb. this one is usually a FlightServerError
-        return UnknownError(message)
+    # Find all known status codes in one scan, but pick them by priority.
+    found = set(_STATUS_PATTERN.findall(message))
+    for status, exception in _STATUS_EXCEPTIONS.items():
+        if status in found:
+            # nb. UNKNOWN is usually a FlightServerError
+            return exception(message)
 
     # give up
     return e
@@ -86,3 +83,14 @@ class InternalError(Exception):
     """
 
     pass
+
+
+# Known gRPC status codes, in order of priority, and their exceptions.
+_STATUS_EXCEPTIONS: Dict[str, Type[Exception]] = {
+    "ALREADY_EXISTS": AlreadyExists,
+    "INVALID_ARGUMENT": InvalidArgument,
+    "NOT_FOUND": NotFound,
+    "INTERNAL": InternalError,
+    "UNKNOWN": UnknownError,
+}
+_STATUS_PATTERN = re.compile("|".join(_STATUS_EXCEPTIONS))
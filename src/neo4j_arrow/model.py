@@ -30,6 +30,8 @@ class _GraphEncoder(JSONEncoder):
 
 
 class Node:
+    __slots__ = ("_source", "_label", "_label_field", "_key_field", "_properties", "_pattern")
+
     def __init__(
         self,
         *,
@@ -101,6 +103,8 @@ class Node:
 
 
 class Edge:
+    __slots__ = ("_source", "_type", "_type_field", "_source_field", "_target_field", "_properties", "_pattern")
+
     def __init__(
         self,
         *,
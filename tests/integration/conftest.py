@@ -1,5 +1,5 @@
 import os
-from typing import Callable
+from typing import Callable, Generator, List
 
 import neo4j
 import pytest
@@ -21,6 +21,14 @@ def gds_version(driver: neo4j.Driver) -> str:
         return version
 
 
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    # keep each phase's report on the test item, so fixtures can check the outcome on teardown
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+
+
 @pytest.fixture(scope="module")
 def neo4j():
     testcontainers.neo4j.Neo4jContainer.NEO4J_USER = "neo4j"
@@ -44,6 +52,8 @@ def neo4j():
 
     yield container
 
+    # pooled connections point at this container, so close them before it goes away
+    Neo4jArrowClient.close_pool()
     container.stop()
 
 
@@ -57,19 +67,37 @@ def driver(neo4j):
 
 
 @pytest.fixture(scope="module")
-def arrow_client_factory(neo4j, driver) -> Callable[[str], Neo4jArrowClient]:
+def proc_names(driver) -> neo4j_arrow._client.ProcedureNames:
+    return neo4j_arrow._client.procedure_names(gds_version(driver))
+
+
+@pytest.fixture
+def arrow_client_factory(request, neo4j, proc_names) -> Generator[Callable[[str], Neo4jArrowClient], None, None]:
+    clients: List[Neo4jArrowClient] = []
+
     def _arrow_client_factory(graph_name: str) -> Neo4jArrowClient:
-        return Neo4jArrowClient(
+        client = Neo4jArrowClient(
             neo4j.get_container_host_ip(),
             graph=graph_name,
             user=neo4j.NEO4J_USER,
             password=neo4j.NEO4J_ADMIN_PASSWORD,
             port=int(neo4j.get_exposed_port(8491)),
             tls=False,
-            proc_names=neo4j_arrow._client.procedure_names(gds_version(driver)),
+            proc_names=proc_names,
         )
-
-    return _arrow_client_factory
+        clients.append(client)
+        return client
+
+    yield _arrow_client_factory
+
+    # hand connections of passing tests back to the pool, so later tests skip connecting and authenticating;
+    # a failed test may have left a connection mid-stream, so close those instead
+    report = getattr(request.node, "rep_call", None)
+    for client in clients:
+        if report is not None and report.passed:
+            client._release()
+        else:
+            client._discard()
 
 
 @pytest.fixture(autouse=True)
@@ -1,4 +1,9 @@
+from typing import Union
+
+import numpy as np
 import pyarrow
+import pyarrow.compute as pc
+import pytest
 
 from neo4j_arrow.model import Graph, Node, Edge
 
@@ -13,6 +18,48 @@ answer_id_base = 3000
 answer_node_id_base = 200
 
 
+# the source table's name is kept in the schema metadata, see write_nodes(..., "_table")
+users_schema = pyarrow.schema(
+    [
+        ("node_id", pyarrow.int64()),
+        ("id", pyarrow.int64()),
+        ("user_name", pyarrow.string()),
+        ("full_name", pyarrow.string()),
+        ("label", pyarrow.string()),
+    ],
+    metadata={"_table": "users"},
+)
+questions_schema = pyarrow.schema(
+    [
+        ("node_id", pyarrow.int64()),
+        ("id", pyarrow.int64()),
+        ("text", pyarrow.string()),
+        ("user_id", pyarrow.int64()),
+        ("user_node_id", pyarrow.int64()),
+        ("label", pyarrow.string()),
+        ("asked_by_type", pyarrow.string()),
+    ],
+    metadata={"_table": "questions"},
+)
+answers_schema = pyarrow.schema(
+    [
+        ("node_id", pyarrow.int64()),
+        ("id", pyarrow.int64()),
+        ("question_id", pyarrow.int64()),
+        ("user_id", pyarrow.int64()),
+        ("text", pyarrow.string()),
+        ("question_node_id", pyarrow.int64()),
+        ("user_node_id", pyarrow.int64()),
+        ("label", pyarrow.string()),
+        ("authored_by_type", pyarrow.string()),
+        ("answer_for_type", pyarrow.string()),
+    ],
+    metadata={"_table": "answers"},
+)
+
+
+# Test data is built once per session and shared; Arrow tables are immutable.
+@pytest.fixture(scope="session")
 def graph_model() -> Graph:
     return (
         Graph(name="graph")
@@ -28,68 +75,64 @@ def graph_model() -> Graph:
     )
 
 
-def users_table() -> pyarrow.Table:
-    node_ids = [user_node_id_base + seq for seq in range(0, user_count)]
-    names = ["node_id", "id", "user_name", "full_name", "label"]
-    node_ids_data = pyarrow.array(list(node_ids))
-    ids_data = pyarrow.array([seq + user_id_base for seq in node_ids])
-    user_names_data = pyarrow.array([f"user_{seq + user_id_base}" for seq in node_ids])
-    full_name_data = pyarrow.array([f"full_{seq + user_id_base} name_{seq + user_id_base}" for seq in node_ids])
-    labels_data = pyarrow.array(["User" for _ in node_ids])
+def _labels(value: str, count: int) -> pyarrow.Array:
+    return pyarrow.repeat(pyarrow.scalar(value, pyarrow.string()), count)
 
-    result = pyarrow.Table.from_arrays(
-        [node_ids_data, ids_data, user_names_data, full_name_data, labels_data], names=names
-    ).replace_schema_metadata({"_table": "users"})
 
-    return result
+def _strings(*parts: Union[str, np.ndarray]) -> pyarrow.Array:
+    # formats all rows at once in Arrow, e.g. _strings("user_", ids) instead of f"user_{id}" per row
+    columns = (pc.cast(pyarrow.array(p), pyarrow.string()) if isinstance(p, np.ndarray) else p for p in parts)
+    return pc.binary_join_element_wise(*columns, "")
 
 
-def questions_table() -> pyarrow.Table:
-    node_ids = [question_node_id_base + seq for seq in range(0, question_count)]
-    names = ["node_id", "id", "text", "user_id", "user_node_id", "label", "asked_by_type"]
-    node_ids_data = pyarrow.array(list(node_ids))
-    ids_data = pyarrow.array([seq + question_id_base for seq in node_ids])
-    text_data = pyarrow.array([f"question {seq}" for seq in node_ids])
-    user_id_data = pyarrow.array([seq % user_count + user_id_base for seq in node_ids])
-    user_node_id_data = pyarrow.array([seq % user_count + user_node_id_base for seq in node_ids])
-    label_data = pyarrow.array(["Question" for _ in node_ids])
-    asked_by_type = pyarrow.array(["ASKED_BY" for _ in node_ids])
+@pytest.fixture(scope="session")
+def users_table() -> pyarrow.Table:
+    node_ids = np.arange(user_count, dtype=np.int64) + user_node_id_base
+    ids = node_ids + user_id_base
+    node_ids_data = pyarrow.array(node_ids)
+    ids_data = pyarrow.array(ids)
+    user_names_data = _strings("user_", ids)
+    full_name_data = _strings("full_", ids, " name_", ids)
+    labels_data = _labels("User", user_count)
+
+    return pyarrow.Table.from_arrays(
+        [node_ids_data, ids_data, user_names_data, full_name_data, labels_data], schema=users_schema
+    )
 
-    result = pyarrow.Table.from_arrays(
-        [node_ids_data, ids_data, text_data, user_id_data, user_node_id_data, label_data, asked_by_type], names=names
-    ).replace_schema_metadata({"_table": "questions"})
 
-    return result
+@pytest.fixture(scope="session")
+def questions_table() -> pyarrow.Table:
+    node_ids = np.arange(question_count, dtype=np.int64) + question_node_id_base
+    node_ids_data = pyarrow.array(node_ids)
+    ids_data = pyarrow.array(node_ids + question_id_base)
+    text_data = _strings("question ", node_ids)
+    user_id_data = pyarrow.array(node_ids % user_count + user_id_base)
+    user_node_id_data = pyarrow.array(node_ids % user_count + user_node_id_base)
+    label_data = _labels("Question", question_count)
+    asked_by_type = _labels("ASKED_BY", question_count)
+
+    return pyarrow.Table.from_arrays(
+        [node_ids_data, ids_data, text_data, user_id_data, user_node_id_data, label_data, asked_by_type],
+        schema=questions_schema,
+    )
 
 
+@pytest.fixture(scope="session")
 def answers_table() -> pyarrow.Table:
-    node_ids = [answer_node_id_base + seq for seq in range(0, answer_count)]
-    names = [
-        "node_id",
-        "id",
-        "question_id",
-        "user_id",
-        "text",
-        "question_node_id",
-        "user_node_id",
-        "label",
-        "authored_by_type",
-        "answer_for_type",
-    ]
-    node_ids_data = pyarrow.array(list(node_ids))
-    ids_data = pyarrow.array([seq + answer_id_base for seq in node_ids])
-    question_id_data = pyarrow.array([seq % question_count + question_id_base for seq in node_ids])
-    user_id_data = pyarrow.array([seq % user_count + user_id_base for seq in node_ids])
-    text_data = pyarrow.array(
-        [f"answer {seq + answer_id_base} for question {seq % question_count + question_id_base}" for seq in node_ids]
-    )
-    question_node_id_data = pyarrow.array([seq % question_count + question_node_id_base for seq in node_ids])
-    user_node_id_data = pyarrow.array([seq % user_count + user_node_id_base for seq in node_ids])
-    label_data = pyarrow.array(["Answer" for _ in node_ids])
-    authored_by_type_data = pyarrow.array(["AUTHORED_BY" for _ in node_ids])
-    answer_for_type_data = pyarrow.array(["ANSWER_FOR" for _ in node_ids])
-
-    result = pyarrow.Table.from_arrays(
+    node_ids = np.arange(answer_count, dtype=np.int64) + answer_node_id_base
+    question_ids = node_ids % question_count + question_id_base
+    node_ids_data = pyarrow.array(node_ids)
+    ids_data = pyarrow.array(node_ids + answer_id_base)
+    question_id_data = pyarrow.array(question_ids)
+    user_id_data = pyarrow.array(node_ids % user_count + user_id_base)
+    text_data = _strings("answer ", node_ids + answer_id_base, " for question ", question_ids)
+    question_node_id_data = pyarrow.array(node_ids % question_count + question_node_id_base)
+    user_node_id_data = pyarrow.array(node_ids % user_count + user_node_id_base)
+    label_data = _labels("Answer", answer_count)
+    authored_by_type_data = _labels("AUTHORED_BY", answer_count)
+    answer_for_type_data = _labels("ANSWER_FOR", answer_count)
+
+    return pyarrow.Table.from_arrays(
         [
             node_ids_data,
             ids_data,
@@ -102,21 +145,16 @@ def answers_table() -> pyarrow.Table:
             authored_by_type_data,
             answer_for_type_data,
         ],
-        names=names,
-    ).replace_schema_metadata({"_table": "answers"})
-
-    return result
-
+        schema=answers_schema,
+    )
 
-def test_write_nodes_only(driver, arrow_client_factory):
-    users = users_table()
-    model = graph_model()
 
+def test_write_nodes_only(driver, arrow_client_factory, users_table, graph_model):
     # send data
     graph_name = "user_graph"
     arrow_client = arrow_client_factory(graph_name)
     arrow_client.start_create_graph()
-    arrow_client.write_nodes(users, model, "_table")
+    arrow_client.write_nodes(users_table, graph_model, "_table")
     arrow_client.nodes_done()
     arrow_client.edges_done()
 
@@ -134,19 +172,15 @@ def test_write_nodes_only(driver, arrow_client_factory):
         assert result[0]["relationshipCount"] == 0
 
 
-def test_write_nodes_and_rels(driver, arrow_client_factory):
-    users = users_table()
-    questions = questions_table()
-    model = graph_model()
-
+def test_write_nodes_and_rels(driver, arrow_client_factory, users_table, questions_table, graph_model):
     # send data
     graph_name = "user_and_questions_graph"
     arrow_client = arrow_client_factory(graph_name)
     arrow_client.start_create_graph()
-    arrow_client.write_nodes(users, model, "_table")
-    arrow_client.write_nodes(questions, model, "_table")
+    arrow_client.write_nodes(users_table, graph_model, "_table")
+    arrow_client.write_nodes(questions_table, graph_model, "_table")
     arrow_client.nodes_done()
-    arrow_client.write_edges(questions, model, "_table")
+    arrow_client.write_edges(questions_table, graph_model, "_table")
     arrow_client.edges_done()
 
     # assert what we have
@@ -163,14 +197,7 @@ def test_write_nodes_and_rels(driver, arrow_client_factory):
         assert result[0]["relationshipCount"] == question_count
 
 
-def test_write_whole_graph(driver, arrow_client_factory):
-    users = users_table()
-    questions = questions_table()
-    answers = answers_table()
-    model = graph_model()
-
-    # send data
-    graph_name = "whole_graph"
+def write_whole_graph(arrow_client_factory, users, questions, answers, model, graph_name):
     arrow_client = arrow_client_factory(graph_name)
     arrow_client.start_create_graph()
     arrow_client.write_nodes(users, model, "_table")
@@ -181,6 +208,12 @@ def test_write_whole_graph(driver, arrow_client_factory):
     arrow_client.write_edges(answers, model, "_table")
     arrow_client.edges_done()
 
+
+def test_write_whole_graph(driver, arrow_client_factory, users_table, questions_table, answers_table, graph_model):
+    # send data
+    graph_name = "whole_graph"
+    write_whole_graph(arrow_client_factory, users_table, questions_table, answers_table, graph_model, graph_name)
+
     # assert what we have
     with driver.session() as session:
         result = session.run(
@@ -195,26 +228,34 @@ def test_write_whole_graph(driver, arrow_client_factory):
         assert result[0]["relationshipCount"] == question_count + answer_count
 
 
-def test_read_graph(driver, arrow_client_factory):
-    # construct a graph
-    test_write_whole_graph(driver, arrow_client_factory)
+def test_read_graph(arrow_client_factory, users_table, questions_table, answers_table, graph_model):
+    # construct a graph; the database is recreated before each test, so it can't be shared with the test above
+    write_whole_graph(arrow_client_factory, users_table, questions_table, answers_table, graph_model, "whole_graph")
 
     # read data
     arrow_client = arrow_client_factory("whole_graph")
-    users = list(arrow_client.read_nodes(properties=["real_id"], labels=["User"], concurrency=1))
-    questions = list(arrow_client.read_nodes(properties=["real_id"], labels=["Question"], concurrency=1))
-    answers = list(arrow_client.read_nodes(properties=["real_id"], labels=["Answer"], concurrency=1))
-
-    assert len(users) == 1
-    assert users[0].num_rows == user_count
-    assert len(questions) == 1
-    assert questions[0].num_rows == question_count
-    assert len(answers) == 1
-    assert answers[0].num_rows == answer_count
-
-    asked_by = list(arrow_client.read_edges(relationship_types=["ASKED_BY"], concurrency=1))
-    answer_for = list(arrow_client.read_edges(relationship_types=["ANSWER_FOR"], concurrency=1))
-    assert len(asked_by) == 1
-    assert asked_by[0].num_rows == question_count
-    assert len(answer_for) == 1
-    assert answer_for[0].num_rows == answer_count
+    users = arrow_client.read_nodes_as_table(properties=["real_id"], labels=["User"], concurrency=1)
+    questions = arrow_client.read_nodes_as_table(properties=["real_id"], labels=["Question"], concurrency=1)
+    answers = arrow_client.read_nodes_as_table(properties=["real_id"], labels=["Answer"], concurrency=1)
+
+    assert users.num_rows == user_count
+    assert questions.num_rows == question_count
+    assert answers.num_rows == answer_count
+
+    asked_by = arrow_client.read_edges_as_table(relationship_types=["ASKED_BY"], concurrency=1)
+    answer_for = arrow_client.read_edges_as_table(relationship_types=["ANSWER_FOR"], concurrency=1)
+    assert asked_by.num_rows == question_count
+    assert answer_for.num_rows == answer_count
+
+    # the streaming variants, which read ahead on a background thread
+    users = arrow_client.read_nodes(properties=["real_id"], labels=["User"], concurrency=1)
+    assert sum(batch.num_rows for batch in users) == user_count
+    asked_by = arrow_client.read_edges(relationship_types=["ASKED_BY"], concurrency=1)
+    assert sum(batch.num_rows for batch in asked_by) == question_count
+
+    # closing a stream early cancels it, and leaves the client usable
+    answers = arrow_client.read_nodes(properties=["real_id"], labels=["Answer"], concurrency=1)
+    assert next(answers).num_rows > 0
+    answers.close()
+    answer_for = arrow_client.read_edges(relationship_types=["ANSWER_FOR"], concurrency=1)
+    assert sum(batch.num_rows for batch in answer_for) == answer_count
@@ -1,4 +1,13 @@
-from neo4j_arrow import Neo4jArrowClient
+import asyncio
+import json
+import pickle
+from types import SimpleNamespace
+
+import pytest
+
+from neo4j_arrow import AsyncNeo4jArrowClient, Neo4jArrowClient, error
+from neo4j_arrow._client import _encode_ticket
+from neo4j_arrow.error import NotFound
 from neo4j_arrow.model import Graph, Node, Edge
 
 import pyarrow as pa
@@ -68,3 +77,550 @@ def test_edge_mapper():
     assert "my_type" not in result.schema.names
     assert "my_src" not in result.schema.names
     assert "my_tgt" not in result.schema.names
+
+
+def test_node_mapper_with_label_reuses_plan():
+    SRC_KEY = "gcs_source"
+    g = Graph(
+        name="junk",
+        nodes=[Node(source="junk", label="Junk", key_field="my_key", my_prop="prop")],
+    )
+    mapper = Neo4jArrowClient._node_mapper(g, SRC_KEY)
+
+    t = pa.table({"my_prop": [1, 2, 3], "my_key": ["a", "b", "c"]})
+    t = t.replace_schema_metadata({SRC_KEY: "junk"})
+    results = [mapper(batch) for batch in t.to_batches(max_chunksize=2)]
+
+    assert [r.num_rows for r in results] == [2, 1]
+    assert results[0].schema.names == ["nodeId", "labels", "prop"]
+    assert results[0].schema.equals(results[1].schema)
+    assert results[1]["labels"].to_pylist() == ["Junk"]
+    assert results[1]["nodeId"].to_pylist() == ["c"]
+
+    table = mapper(t)
+    assert table.schema.equals(results[0].schema)
+    assert table["labels"].to_pylist() == ["Junk"] * 3
+
+
+class FakeStream:
+    def __init__(self, chunks, error=None):
+        self.chunks = chunks
+        self.error = error
+        self.cancelled = False
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            yield SimpleNamespace(data=chunk, app_metadata=None)
+        if self.error:
+            raise self.error
+
+    def cancel(self):
+        self.cancelled = True
+
+    @property
+    def schema(self):
+        return self.chunks[0].schema
+
+    def read_all(self):
+        return pa.Table.from_batches(self.chunks)
+
+
+class FakeFlightClient:
+    def __init__(self, stream):
+        self.stream = stream
+        self.tickets = []
+
+    def do_get(self, ticket, options):
+        self.tickets.append(ticket.ticket)
+        return self.stream
+
+
+def test_get_chunks_prefetches_in_order():
+    batches = [pa.record_batch([pa.array([i])], names=["nodeId"]) for i in range(20)]
+    client = Neo4jArrowClient("localhost", "graph")
+    client.client = FakeFlightClient(FakeStream(batches))
+
+    assert list(client._get_chunks(b"{}")) == batches
+
+
+def test_get_chunks_propagates_errors():
+    batches = [pa.record_batch([pa.array([1])], names=["nodeId"])]
+    client = Neo4jArrowClient("localhost", "graph")
+    client.client = FakeFlightClient(FakeStream(batches, error=pa.ArrowException("NOT_FOUND: no graph")))
+
+    chunks = client._get_chunks(b"{}")
+    assert next(chunks) == batches[0]
+    with pytest.raises(NotFound):
+        next(chunks)
+
+
+def test_get_chunks_cancels_on_early_exit():
+    stream = FakeStream([pa.record_batch([pa.array([i])], names=["nodeId"]) for i in range(100)])
+    client = Neo4jArrowClient("localhost", "graph")
+    client.client = FakeFlightClient(stream)
+
+    chunks = client._get_chunks(b"{}")
+    next(chunks)
+    chunks.close()
+    assert stream.cancelled
+
+
+def test_read_edges_reuses_encoded_ticket():
+    client = Neo4jArrowClient("localhost", "graph", database="db")
+    client.client = FakeFlightClient(FakeStream([]))
+
+    hits = _encode_ticket.cache_info().hits
+    for _ in range(2):
+        list(client.read_edges(properties=["weight"], relationship_types=["KNOWS"], concurrency=2))
+
+    first, second = client.client.tickets
+    assert first == second
+    assert _encode_ticket.cache_info().hits == hits + 1
+    assert json.loads(first) == {
+        "graph_name": "graph",
+        "database_name": "db",
+        "procedure_name": "gds.graph.relationshipProperties.stream",
+        "configuration": {"relationship_properties": ["weight"], "relationship_types": ["KNOWS"]},
+        "concurrency": 2,
+    }
+
+
+def test_read_edges_splits_types_over_streams(monkeypatch):
+    copies = []
+
+    def _copy(self):
+        other = Neo4jArrowClient("localhost", "graph")
+        other.client = FakeFlightClient(FakeStream([pa.record_batch([pa.array([1])], names=["sourceNodeId"])]))
+        copies.append(other.client)
+        return other
+
+    monkeypatch.setattr(Neo4jArrowClient, "copy", _copy)
+    monkeypatch.setattr(Neo4jArrowClient, "_pool", {})
+    client = Neo4jArrowClient("localhost", "graph")
+
+    chunks = list(client.read_edges(relationship_types=["A", "B", "C"], streams=2))
+
+    assert len(chunks) == 2
+    types = sorted(json.loads(fake.tickets[0])["configuration"]["relationship_types"] for fake in copies)
+    assert types == [["A", "C"], ["B"]]
+
+
+def test_async_client_streams_nodes():
+    batches = [pa.record_batch([pa.array([i])], names=["nodeId"]) for i in range(3)]
+    client = Neo4jArrowClient("localhost", "graph")
+    client.client = FakeFlightClient(FakeStream(batches))
+
+    async def _read():
+        async with AsyncNeo4jArrowClient(client) as async_client:
+            return [chunk async for chunk in async_client.read_nodes(["prop"])]
+
+    assert asyncio.run(_read()) == batches
+
+
+def test_async_client_closes_abandoned_streams():
+    batches = [pa.record_batch([pa.array([i])], names=["nodeId"]) for i in range(20)]
+    client = Neo4jArrowClient("localhost", "graph")
+    stream = FakeStream(batches)
+    client.client = FakeFlightClient(stream)
+
+    async def _read_one():
+        async with AsyncNeo4jArrowClient(client) as async_client:
+            chunks = async_client.read_nodes(["prop"])
+            async for chunk in chunks:
+                break
+            await chunks.aclose()
+            return chunk
+
+    assert asyncio.run(_read_one()) == batches[0]
+    assert stream.cancelled
+
+
+def test_reuse_for_same_schema():
+    calls = []
+
+    def _fn(data):
+        calls.append(data)
+        return len(calls)
+
+    fn = Neo4jArrowClient._reuse_for_same_schema(_fn)
+    t = pa.table({"a": [1, 2, 3]}).replace_schema_metadata({"src": "one"})
+    batches = t.to_batches(max_chunksize=1)
+
+    assert [fn(b) for b in batches] == [1, 1, 1]
+    assert fn(t.replace_schema_metadata({"src": "two"})) == 2
+    assert fn(batches[0]) == 3
+
+
+def test_edge_mapper_dictionary_encodes_types():
+    g = Graph(
+        name="junk",
+        edges=[Edge(source="junk", type_field="my_type", source_field="my_src", target_field="my_tgt")],
+    )
+    mapper = Neo4jArrowClient._edge_mapper(g, "src", dictionary_encode=True)
+
+    t = pa.table({"my_type": ["A", "B", "A"], "my_src": [1, 2, 3], "my_tgt": [3, 2, 1]})
+    t = t.replace_schema_metadata({"src": "junk"})
+
+    for result in [mapper(t), mapper(t.to_batches()[0])]:
+        assert result.schema.field("relationshipType").type == pa.dictionary(pa.int32(), pa.string())
+        assert result["relationshipType"].to_pylist() == ["A", "B", "A"]
+
+
+def test_node_mapper_dictionary_encodes_constant_label():
+    g = Graph(name="junk", nodes=[Node(source="junk", label="Junk", key_field="id")])
+    mapper = Neo4jArrowClient._node_mapper(g, "src", dictionary_encode=True)
+
+    t = pa.table({"id": [1, 2, 3]}).replace_schema_metadata({"src": "junk"})
+
+    for result in [mapper(t), mapper(t.to_batches()[0])]:
+        assert result.schema.field("labels").type == pa.dictionary(pa.int32(), pa.string())
+        assert result["labels"].to_pylist() == ["Junk", "Junk", "Junk"]
+
+
+def test_interpret_prefers_known_status_by_priority():
+    e = error.interpret(pa.ArrowException("INTERNAL: wrapped NOT_FOUND: no graph"))
+    assert isinstance(e, error.NotFound)
+    assert e.message == "INTERNAL: wrapped NOT_FOUND: no graph"
+
+    unknown = ValueError("something else")
+    assert error.interpret(unknown) is unknown
+
+
+def test_node_mapper_shares_constant_label_column():
+    g = Graph(name="junk", nodes=[Node(source="junk", label="Junk", key_field="id")])
+    mapper = Neo4jArrowClient._node_mapper(g, "src")
+
+    first, second = pa.table({"id": [1, 2, 3, 4]}).replace_schema_metadata({"src": "junk"}).to_batches(max_chunksize=2)
+    labels = mapper(first)["labels"], mapper(second)["labels"]
+    assert labels[0].to_pylist() == ["Junk", "Junk"]
+    assert labels[0].buffers()[2].address == labels[1].buffers()[2].address
+
+    # columns are cached per mapper, not kept alive across uploads
+    other = Neo4jArrowClient._node_mapper(g, "src")(first)["labels"]
+    assert other.buffers()[2].address != labels[0].buffers()[2].address
+
+
+def test_node_mapper_missing_field():
+    g = Graph(name="junk", nodes=[Node(source="junk", label="Junk", key_field="id", name="name")])
+    mapper = Neo4jArrowClient._node_mapper(g, "src")
+
+    t = pa.table({"id": [1, 2, 3]}).replace_schema_metadata({"src": "junk"})
+    with pytest.raises(Exception, match="name"):
+        mapper(t)
+
+
+def test_rows_per_chunk_respects_write_size_limit():
+    client = Neo4jArrowClient("localhost", "graph", max_chunk_size=1_000, write_size_limit_bytes=80_000)
+
+    narrow = pa.table({"nodeId": pa.array(range(10_000), pa.int64())})
+    assert client._rows_per_chunk(narrow) == 1_000
+
+    wide = pa.table({f"p{i}": pa.array(range(10_000), pa.int64()) for i in range(100)})
+    rows = client._rows_per_chunk(wide)
+    assert 90 <= rows < 100  # 100 rows of data, less room for the message metadata
+    assert pa.ipc.get_record_batch_size(wide.to_batches(max_chunksize=rows)[0]) <= 80_000
+
+
+def test_pickle_drops_connection():
+    client = Neo4jArrowClient("localhost", "graph", concurrency=2)
+    client.client = FakeFlightClient(FakeStream([]))
+
+    copy = pickle.loads(pickle.dumps(client))
+    assert copy.client is None and copy.call_opts is None
+    assert (copy.host, copy.graph, copy.concurrency) == ("localhost", "graph", 2)
+
+
+class SlottedClient(Neo4jArrowClient):
+    __slots__ = ("tenant",)
+
+
+def test_pickle_keeps_subclass_and_base_slots():
+    client = SlottedClient("localhost", "graph", concurrency=2)
+    client.tenant = "acme"
+    client.client = FakeFlightClient(FakeStream([]))
+
+    for copy in (pickle.loads(pickle.dumps(client)), client.copy()):
+        assert type(copy) is SlottedClient
+        assert copy.client is None
+        assert (copy.host, copy.graph, copy.concurrency, copy.tenant) == ("localhost", "graph", 2, "acme")
+
+
+def test_coalesce_small_batches():
+    batches = [pa.record_batch([pa.array(range(i, i + 3))], names=["nodeId"]) for i in range(0, 30, 3)]
+    big = pa.record_batch([pa.array(range(100))], names=["nodeId"])
+
+    result = list(Neo4jArrowClient._coalesce(batches[:5] + [big] + batches[5:], 7))
+
+    assert [batch.num_rows for batch in result] == [6, 6, 3, 100, 6, 6, 3]
+    assert result[4].column(0).to_pylist() == [15, 16, 17, 18, 19, 20]
+
+    # the byte limit applies to IPC messages, including their metadata
+    overhead = pa.ipc.get_record_batch_size(batches[0].slice(0, 0))
+    limit = 2 * pa.ipc.get_record_batch_size(batches[0]) - overhead
+    merged = list(Neo4jArrowClient._coalesce(batches, 7, limit))
+    assert [batch.num_rows for batch in merged] == [6] * 5
+    assert all(pa.ipc.get_record_batch_size(batch) <= limit for batch in merged)
+    merged = list(Neo4jArrowClient._coalesce(batches, 7, limit - 1))
+    assert [batch.num_rows for batch in merged] == [3] * 10
+
+    small = [pa.record_batch([pa.array(range(i, i + 10), pa.int64())], names=["nodeId"]) for i in range(0, 5000, 10)]
+    merged = list(Neo4jArrowClient._coalesce(small, 10_000, 4096))
+    assert sum(batch.num_rows for batch in merged) == 5000
+    assert all(pa.ipc.get_record_batch_size(batch) <= 4096 for batch in merged)
+
+
+class FlakyWriter:
+    def __init__(self, failures):
+        self.failures = failures
+        self.attempts = 0
+
+    def write_batch(self, batch):
+        self.attempts += 1
+        if self.attempts <= self.failures:
+            raise pa.flight.FlightUnavailableError("try again")
+
+
+def test_write_batch_retries_transient_errors():
+    batch = pa.record_batch([pa.array([1])], names=["nodeId"])
+    client = Neo4jArrowClient("localhost", "graph", max_retries=2, retry_backoff=0.0)
+
+    writer = FlakyWriter(failures=2)
+    client._write_batch_with_retries(batch, writer)
+    assert writer.attempts == 3
+
+    with pytest.raises(pa.flight.FlightUnavailableError):
+        client._write_batch_with_retries(batch, FlakyWriter(failures=3))
+
+
+class FakeAuthFlightClient:
+    authentications = 0
+
+    def __init__(self, location, **kwargs):
+        pass
+
+    def authenticate_basic_token(self, user, password):
+        FakeAuthFlightClient.authentications += 1
+        return b"authorization", b"Bearer token"
+
+    def close(self):
+        pass
+
+
+def test_unpickled_client_reuses_auth_token(monkeypatch):
+    monkeypatch.setattr(pa.flight, "FlightClient", FakeAuthFlightClient)
+    monkeypatch.setattr(FakeAuthFlightClient, "authentications", 0)
+    monkeypatch.setattr(Neo4jArrowClient, "_pool", {})
+    client = Neo4jArrowClient("localhost", "graph")
+    client._client()
+
+    worker = pickle.loads(pickle.dumps(client))
+    worker._client()
+    assert FakeAuthFlightClient.authentications == 1
+    assert worker.auth_header == (b"authorization", b"Bearer token")
+
+    worker.reauthenticate()
+    worker._client()
+    assert FakeAuthFlightClient.authentications == 2
+
+    # a released copy's pooled connection carries its token to the next taker
+    copy = worker.copy()
+    copy._client()
+    copy._release()
+    fresh = Neo4jArrowClient("localhost", "graph")
+    fresh._client()
+    assert FakeAuthFlightClient.authentications == 2
+    assert fresh.auth_header == (b"authorization", b"Bearer token")
+    fresh._release()
+
+    # ... but reauthenticating drops pooled connections holding the old token
+    worker.reauthenticate()
+    worker._client()
+    assert FakeAuthFlightClient.authentications == 3
+    assert worker.auth_header == (b"authorization", b"Bearer token")
+    assert Neo4jArrowClient._pool == {}
+
+
+def test_write_shards_pulls_lazily_from_iterators(monkeypatch):
+    written = []
+
+    def _write_batches(self, desc, batches, mapping_fn=None, max_rows=None):
+        batches = list(batches)
+        written.extend(batch["n"][0].as_py() for batch in batches)
+        return sum(batch.num_rows for batch in batches), sum(batch.nbytes for batch in batches)
+
+    monkeypatch.setattr(Neo4jArrowClient, "_write_batches", _write_batches)
+    client = Neo4jArrowClient("localhost", "graph", concurrency=3)
+    batches = (pa.RecordBatch.from_pydict({"n": [i, i]}) for i in range(10))
+
+    n_rows, _ = client._write_shards({}, batches)
+    assert n_rows == 20
+    assert sorted(written) == list(range(10))
+
+    written.clear()
+    table = pa.table({"n": list(range(10))})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as stream:
+        for batch in table.to_batches(max_chunksize=1):
+            stream.write_batch(batch)
+    n_rows, _ = client._write_shards({}, pa.ipc.open_stream(sink.getvalue()))
+    assert n_rows == 10
+    assert sorted(written) == list(range(10))
+
+    with pytest.raises(Exception, match="no record batches"):
+        client._write_shards({}, iter([]))
+
+
+def test_write_shards_splits_lists_round_robin(monkeypatch):
+    shards = []
+
+    def _write_batches(self, desc, batches, mapping_fn=None, max_rows=None):
+        batches = list(batches)
+        shards.append([batch["n"][0].as_py() for batch in batches])
+        return sum(batch.num_rows for batch in batches), sum(batch.nbytes for batch in batches)
+
+    monkeypatch.setattr(Neo4jArrowClient, "_write_batches", _write_batches)
+    client = Neo4jArrowClient("localhost", "graph", concurrency=3)
+    batches = [pa.RecordBatch.from_pydict({"n": [i] * (i + 1)}) for i in range(7)]
+
+    n_rows, n_bytes = client._write_shards({}, batches)
+    assert sorted(shards) == [[0, 3, 6], [1, 4], [2, 5]]
+    assert n_rows == sum(range(1, 8))
+    assert n_bytes == sum(batch.nbytes for batch in batches)
+
+
+class FakeUploadClient:
+    def __init__(self):
+        self.written = []
+
+    def do_put(self, descriptor, schema, options):
+        return FakeUploadWriter(self.written), SimpleNamespace(read=lambda: None)
+
+
+class FakeUploadWriter:
+    def __init__(self, written):
+        self.written = written
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def write_batch(self, batch):
+        self.written.append(batch)
+
+
+def test_write_batches_maps_each_batch_once():
+    mapped = []
+
+    def _mapper(batch):
+        mapped.append(batch["n"][0].as_py())
+        return pa.RecordBatch.from_arrays(batch.columns, names=["nodeId"])
+
+    client = Neo4jArrowClient("localhost", "graph", max_chunk_size=1)
+    client.client = FakeUploadClient()
+    batches = (pa.RecordBatch.from_pydict({"n": [i]}) for i in range(5))
+
+    assert client._write_batches({"name": "graph", "entity_type": "node"}, batches, _mapper)[0] == 5
+    assert mapped == list(range(5))
+    assert [batch.schema.names for batch in client.client.written] == [["nodeId"]] * 5
+
+
+def test_copy_keeps_configuration_but_not_connection():
+    client = Neo4jArrowClient("localhost", "graph", concurrency=2, compression="zstd", max_retries=3)
+    client.client = FakeUploadClient()
+    client.auth_header = (b"authorization", b"Bearer token")
+
+    copy = client.copy()
+    assert copy.client is None and copy.call_opts is None
+    assert copy.__getstate__() == client.__getstate__()
+
+
+def test_read_nodes_as_table():
+    batches = [pa.record_batch([pa.array([i, i])], names=["nodeId"]) for i in range(3)]
+    client = Neo4jArrowClient("localhost", "graph")
+    client.client = FakeFlightClient(FakeStream(batches))
+
+    table = client.read_nodes_as_table(["prop"], labels=["User"])
+    assert isinstance(table, pa.Table)
+    assert table.num_rows == 6
+    assert json.loads(client.client.tickets[0])["configuration"]["node_labels"] == ["User"]
+
+
+def test_read_nodes_into_sink():
+    batches = [pa.record_batch([pa.array([i, i])], names=["nodeId"]) for i in range(3)]
+    client = Neo4jArrowClient("localhost", "graph")
+    client.client = FakeFlightClient(FakeStream(batches))
+
+    sink = pa.BufferOutputStream()
+    assert client.read_nodes_into(sink, ["prop"], labels=["User"]) == 6
+    table = pa.ipc.open_stream(sink.getvalue()).read_all()
+    assert table.column("nodeId").to_pylist() == [0, 0, 1, 1, 2, 2]
+
+
+def test_write_nodes_respects_batch_rows():
+    client = Neo4jArrowClient("localhost", "graph", concurrency=1)
+    client.client = FakeUploadClient()
+
+    assert client.write_nodes(pa.table({"nodeId": range(1000)}), batch_rows=100)[0] == 1000
+    assert [batch.num_rows for batch in client.client.written] == [100] * 10
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_released_connections_are_reused(monkeypatch):
+    monkeypatch.setattr(Neo4jArrowClient, "_pool", {})
+    client = Neo4jArrowClient("localhost", "graph")
+    connection = client.client = FakeConnection()
+
+    client._release()
+    assert client.client is None
+    other = Neo4jArrowClient("localhost", "other_graph")
+    assert other._client() is connection
+    assert not connection.closed
+
+
+def test_failed_copies_are_closed_not_pooled(monkeypatch):
+    monkeypatch.setattr(Neo4jArrowClient, "_pool", {})
+    client = Neo4jArrowClient("localhost", "graph")
+    connections = []
+
+    def _copy(self):
+        other = Neo4jArrowClient("localhost", "graph")
+        other.client = FakeConnection()
+        connections.append(other.client)
+        return other
+
+    monkeypatch.setattr(Neo4jArrowClient, "copy", _copy)
+    with pytest.raises(RuntimeError):
+        with client._borrow_copy():
+            raise RuntimeError("stream failed")
+    with client._borrow_copy():
+        pass
+
+    failed, succeeded = connections
+    assert failed.closed
+    assert not succeeded.closed
+    assert Neo4jArrowClient._pool == {client._pool_key(): [(succeeded, None, None)]}
+
+
+def test_pool_is_bounded_and_can_be_closed(monkeypatch):
+    monkeypatch.setattr(Neo4jArrowClient, "_pool", {})
+    monkeypatch.setattr("neo4j_arrow._client.MAX_POOLED_CLIENTS", 2)
+    connections = []
+    for _ in range(3):
+        client = Neo4jArrowClient("localhost", "graph")
+        client.client = FakeConnection()
+        connections.append(client.client)
+        client._release()
+
+    assert [connection.closed for connection in connections] == [False, False, True]
+    Neo4jArrowClient.close_pool()
+    assert all(connection.closed for connection in connections)
+    assert Neo4jArrowClient._pool == {}
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from neo4j_arrow.model import Graph, Node, Edge, ValidationError
@@ -184,3 +186,12 @@ def test_model_validate():
     Graph(name="graph", db="db").with_node(Node(source="node", key_field="id", label_field="label")).with_edge(
         Edge(source="edge", source_field="source_id", target_field="target_id", type_field="type")
     ).validate()
+
+
+def test_nodes_and_edges_pickle():
+    node = Node(source="n_.*", label="Label", key_field="key", prop="prop")
+    edge = Edge(source="r_.*", edge_type="REL", source_field="src", target_field="tgt")
+
+    node2, edge2 = pickle.loads(pickle.dumps((node, edge)))
+    assert node2.to_dict() == node.to_dict() and node2.matches("n_1")
+    assert edge2.to_dict() == edge.to_dict() and edge2.matches("r_1")